@@ -9,7 +9,7 @@ import os
 from typing import List, Dict, Any
 
 from config.settings import Settings
-from utils.helpers import check_permissions, format_song_requests
+from utils.helpers import check_permissions, format_song_requests, update_request_numbers
 from utils.logger import get_logger
 from tracord.core.events import EventTopic, emit_event
 
@@ -45,10 +45,9 @@ class RequestsCog(commands.Cog, name="Requests"):
         except Exception as exc:
             logger.error(f"Error saving song requests: {exc}")
     
-    def _update_request_numbers(self, song_requests: List[Dict[str, Any]]) -> None:
-        """Update request numbers to be sequential"""
-        for i, req in enumerate(song_requests):
-            req["RequestNumber"] = i + 1
+    def _update_request_numbers(self, song_requests: List[Dict[str, Any]], start: int = 0) -> None:
+        """Update request numbers to be sequential from index *start* onward"""
+        update_request_numbers(song_requests, start)
     
     @app_commands.command(name="srbreqlist", description="Display all songs currently in the song request list")
     async def srbreqlist(self, interaction: discord.Interaction):
@@ -149,7 +148,8 @@ class RequestsCog(commands.Cog, name="Requests"):
 
                 # Remove the request and update RequestNumbers
                 song_requests.pop(request_num - 1)
-                self._update_request_numbers(song_requests)
+                # Entries ahead of the removed one keep their numbers
+                self._update_request_numbers(song_requests, start=request_num - 1)
                 self._save_song_requests(song_requests)
                 emit_event(EventTopic.SONG_REQUEST_DELETED, None)  # Emit event for any deletion
 
@@ -4,7 +4,7 @@ Handles settings.json variables, constants, and validation
 """
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 
 from tracord.infra.settings import SettingsModel, load_settings
 from utils.logger import get_logger
@@ -55,8 +55,9 @@ class Settings:
     COLLECTION_JSON_FILE: str = ""
 
     # Processed Lists (populated in initialize)
-    CHANNEL_IDS: List[int] = []
-    ADMIN_IDS: List[int] = []
+    # Frozensets so the per-interaction permission checks are hashed lookups
+    CHANNEL_IDS: FrozenSet[int] = frozenset()
+    ADMIN_IDS: FrozenSet[int] = frozenset()
     DISCORD_LIVE_NOTIFICATION_ROLES: List[str] = []
     TRAKTOR_PATH: str = ""
     DEBUG: bool = False
@@ -87,8 +88,8 @@ class Settings:
         channel_ids = cls.get('DISCORD_BOT_CHANNEL_IDS') or []
         admin_ids = cls.get('DISCORD_BOT_ADMIN_IDS') or []
         roles = cls.get('DISCORD_LIVE_NOTIFICATION_ROLES') or []
-        cls.CHANNEL_IDS = [int(id) for id in channel_ids]
-        cls.ADMIN_IDS = [int(id) for id in admin_ids]
+        cls.CHANNEL_IDS = frozenset(int(id) for id in channel_ids)
+        cls.ADMIN_IDS = frozenset(int(id) for id in admin_ids)
         cls.DISCORD_LIVE_NOTIFICATION_ROLES = [str(role).strip() for role in roles]
         cls.DEBUG = bool(cls._model.debug if cls._model else cls.get('DEBUG', False))
         # Import additional variables from settings.json
@@ -18,7 +18,7 @@ from tracord.infra.logging import setup_for_environment
 # Import configuration and utilities
 from config.settings import Settings
 from utils.traktor import refresh_collection_json, load_collection_json, count_songs_in_collection_json, get_new_songs_json
-from utils.logger import get_logger
+from utils.logger import get_logger, log_success
 
 setup_for_environment()
 
@@ -50,7 +50,7 @@ class DJBot(commands.Bot):
             for cog in INTERNAL_COGS:
                 try:
                     await self.load_extension(cog)
-                    logger.info(f"✅ Loaded internal {cog}")
+                    log_success(logger, f"✅ Loaded internal {cog}")
                     loaded_cogs.add(cog)
                 except Exception as e:
                     if cog.startswith("extra_cogs."):
@@ -70,7 +70,7 @@ class DJBot(commands.Bot):
                     if cog not in loaded_cogs:
                         try:
                             await self.load_extension(cog)
-                            logger.info(f"✅ Loaded external {cog}")
+                            log_success(logger, f"✅ Loaded external {cog}")
                         except Exception as e:
                             logger.error(f"❌ Failed to load external {cog}: {e}")
         else:
@@ -78,8 +78,8 @@ class DJBot(commands.Bot):
         # Sync slash commands
         try:
             synced = await self.tree.sync()
-            logger.info(f"✅ Synced {len(synced)} slash commands")
-            logger.info("✅ Waiting for Bot initialization...")
+            log_success(logger, f"✅ Synced {len(synced)} slash commands")
+            log_success(logger, "✅ Waiting for Bot initialization...")
         except Exception as e:
             logger.error(f"❌ Failed to sync commands: {e}")
         
@@ -94,7 +94,7 @@ class DJBot(commands.Bot):
         # Initialize collection file
         await self._initialize_collection()
 
-        logger.info('✅ Bot is ready and operational!')
+        log_success(logger, '✅ Bot is ready and operational!')
         logger.info('━' * 50)
 
     async def _initialize_collection(self):
@@ -109,7 +109,7 @@ class DJBot(commands.Bot):
                 debug_mode=Settings.DEBUG
             )
             
-            logger.info(f"✅ Collection imported successfully - {song_count:,} songs processed")
+            log_success(logger, f"✅ Collection imported successfully - {song_count:,} songs processed")
             # Load the JSON collection for statistics
             songs = load_collection_json(Settings.COLLECTION_JSON_FILE)
             if songs:
@@ -148,7 +148,7 @@ async def main():
     except Exception as e:
         logger.error(f"❌ Bot encountered an error: {e}")
     finally:
-        logger.info("👋 Bot shutdown complete")
+        log_success(logger, "👋 Bot shutdown complete")
 
 
 if __name__ == "__main__":
@@ -7,7 +7,7 @@ import logging
 from typing import Optional
 
 from config.settings import Settings
-from utils.logger import get_logger
+from utils.logger import get_logger, log_success
 
 Settings.initialize()
 
@@ -72,7 +72,7 @@ class DiscordBotController:
                     if pending_tasks:
                         loop.run_until_complete(asyncio.gather(*pending_tasks, return_exceptions=True))
                     loop.close()
-                    logger.info("✅ Bot event loop closed properly")
+                    log_success(logger, "✅ Bot event loop closed properly")
                 except Exception as cleanup_error:
                     logger.warning(f"⚠️ Error during event loop cleanup: {cleanup_error}")
             if self.gui_callbacks.get("on_stopped"):
@@ -96,11 +96,11 @@ class DiscordBotController:
                     future = asyncio.run_coroutine_threadsafe(self.bot.close(), self.bot.loop)
                     try:
                         future.result(timeout=3.0)
-                        logger.info("✅ Bot disconnected successfully")
+                        log_success(logger, "✅ Bot disconnected successfully")
                     except Exception:
-                        logger.info("✅ Bot closed")
+                        log_success(logger, "✅ Bot closed")
                 else:
-                    logger.info("✅ Bot closed")
+                    log_success(logger, "✅ Bot closed")
         except Exception as e:
             if "session" not in str(e).lower():
                 logger.error(f"Error stopping bot: {e}")
@@ -109,7 +109,7 @@ class DiscordBotController:
         self.is_running = False
         if self.bot_thread and self.bot_thread.is_alive():
             self.bot_thread.join(timeout=2.0)
-        logger.info("✅ Bot shutdown complete")
+        log_success(logger, "✅ Bot shutdown complete")
         if self.gui_callbacks.get("on_stopped"):
             self.gui_callbacks["on_stopped"]()
 
@@ -3,7 +3,6 @@ import socketserver
 import http.server
 import io
 import os
-import json
 import struct
 import codecs
 import queue
@@ -14,7 +13,8 @@ from datetime import datetime
 from utils.logger import get_logger
 
 from tracord.core.events import EventTopic, emit_event
-from utils.song_matcher import get_song_info
+from utils.song_matcher import get_song_info, preprocess_collection
+from utils.traktor import load_collection_json
 from utils.stats import increment_song_play
 from services.web_overlay import OverlaySong
 from tracord.utils.coverart import ensure_variants
@@ -74,8 +74,8 @@ def create_traktor_handler(status_queue, shutdown_event):
             try:
                 # Load collection once per connection.
                 try:
-                    with open(COLLECTION_PATH, 'r', encoding='utf-8') as f:
-                        collection = json.load(f)
+                    collection = load_collection_json(COLLECTION_PATH)
+                    preprocess_collection(collection)
                 except Exception as e:
                     collection = []
                     logger.warning(f"[Traktor] Could not load collection.json: {e}")
@@ -114,7 +114,7 @@ def create_traktor_handler(status_queue, shutdown_event):
                                             tags[key.upper()] = value
                                     # Only process as a song if there is at least one tag other than ENCODER
                                     tag_keys = set(tags.keys())
-                                    logger.debug(f"[Traktor] Parsed tags: {tags}")
+                                    logger.debug("[Traktor] Parsed tags: %s", tags)
                                     # Only skip if the ONLY tag is ENCODER
                                     if tag_keys == {"ENCODER"}:
                                         total = 0
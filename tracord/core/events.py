@@ -32,6 +32,8 @@ class SongRequestPayload(TypedDict, total=False):
 
 
 class EventTopic(StrEnum):
+    # Members are str instances equal to (and hashing like) their values, so they are
+    # passed to the string-keyed bus as-is; legacy string emitters keep working.
     SONG_PLAYED = "song_played"
     TRAKTOR_SONG = "traktor_song"
     SONG_REQUEST_ADDED = "song_request_added"
@@ -46,24 +48,22 @@ EventHandler = Callable[[Any], None]
 def subscribe_event(topic: EventTopic, handler: EventHandler) -> Callable[[], None]:
     """Register a handler for a typed event topic.
 
-    Returns a callable that can be used to unsubscribe the handler.
+    Returns a callable that can be used to unsubscribe the handler. The handler is
+    registered as-is so bound methods stay weakly referenced by the bus.
     """
 
-    def _adapter(payload: Any) -> None:
-        handler(payload)
+    _subscribe(topic, handler)
 
-    _subscribe(topic.value, _adapter)
+    def _unsubscribe_handler() -> None:
+        _unsubscribe(topic, handler)
 
-    def _unsubscribe_adapter() -> None:
-        _unsubscribe(topic.value, _adapter)
-
-    return _unsubscribe_adapter
+    return _unsubscribe_handler
 
 
 def emit_event(topic: EventTopic, payload: SongEventPayload | SongRequestPayload | Dict[str, Any] | None = None) -> None:
     """Dispatch an event to all subscribers."""
 
-    _emit(topic.value, payload)
+    _emit(topic, payload)
 
 
 __all__ = [
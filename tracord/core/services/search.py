@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, List, Optional
 
-from utils.traktor import load_collection_json, search_collection_json
+from utils.traktor import invalidate_search_index, load_collection_json, search_collection_json
 from utils.logger import get_logger
 
 
@@ -59,6 +59,7 @@ class JsonSearchBackend(SearchBackend):
             self._collection_mtime = None
             return
         self._songs = load_collection_json(str(self.collection_path)) or []
+        invalidate_search_index()
         try:
             self._collection_mtime = self.collection_path.stat().st_mtime
         except FileNotFoundError:
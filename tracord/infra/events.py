@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import threading
-from collections import defaultdict
-from typing import Any, Callable, DefaultDict, Iterable, List, Protocol
+import types
+import weakref
+from typing import Any, Callable, Dict, Iterable, Protocol, Tuple
 
 from utils.logger import get_logger
 
@@ -16,46 +17,90 @@ class Subscriber(Protocol):
         ...
 
 
+_EMPTY: Tuple[Subscriber, ...] = ()
+
+
+def _as_entry(callback: Subscriber) -> Any:
+    # Bound Python methods are held weakly so subscribers don't pin their owners alive;
+    # plain functions, closures and builtin methods (e.g. Qt signal emit) stay strong.
+    if isinstance(callback, types.MethodType):
+        return weakref.WeakMethod(callback)
+    return callback
+
+
 class EventBus:
-    """A lightweight, thread-safe event dispatcher."""
+    """A lightweight, thread-safe event dispatcher.
+
+    Subscriber lists are immutable tuples replaced on (un)subscribe, so ``emit``
+    reads a consistent snapshot without taking the lock or copying. Bound methods
+    are stored as ``WeakMethod`` refs; dead refs are skipped and compacted away.
+    """
 
     def __init__(self) -> None:
-        self._subscribers: DefaultDict[str, List[Subscriber]] = defaultdict(list)
+        self._subscribers: Dict[str, Tuple[Subscriber, ...]] = {}
         self._lock = threading.RLock()
 
     def subscribe(self, event: str, callback: Subscriber) -> None:
         with self._lock:
-            if callback not in self._subscribers[event]:
-                self._subscribers[event].append(callback)
-                logger.debug(f"[EventBus] Subscribed to '{event}': {callback}")
+            callbacks = self._subscribers.get(event, _EMPTY)
+            entry = _as_entry(callback)
+            if entry not in callbacks:
+                self._subscribers[event] = callbacks + (entry,)
+                logger.debug("[EventBus] Subscribed to '%s': %s", event, callback)
 
     def unsubscribe(self, event: str, callback: Subscriber) -> None:
         with self._lock:
             callbacks = self._subscribers.get(event)
-            if not callbacks:
+            entry = _as_entry(callback)
+            if not callbacks or entry not in callbacks:
                 return
-            try:
-                callbacks.remove(callback)
-                logger.debug(f"[EventBus] Unsubscribed from '{event}': {callback}")
-            except ValueError:
-                pass
-            if not callbacks:
+            remaining = tuple(cb for cb in callbacks if cb != entry)
+            logger.debug("[EventBus] Unsubscribed from '%s': %s", event, callback)
+            if remaining:
+                self._subscribers[event] = remaining
+            else:
                 self._subscribers.pop(event, None)
 
     def emit(self, event: str, payload: Any = None) -> None:
-        with self._lock:
-            callbacks = list(self._subscribers.get(event, ()))
+        callbacks = self._subscribers.get(event, _EMPTY)
         if not callbacks:
             return
+        dead = 0
         for callback in callbacks:
+            if type(callback) is weakref.WeakMethod:
+                callback = callback()
+                if callback is None:
+                    dead += 1
+                    continue
             try:
                 callback(payload)
             except Exception as exc:  # pragma: no cover - keep bus alive
                 logger.warning(f"[EventBus] Subscriber error for '{event}': {exc}")
+        if dead and dead * 4 > len(callbacks):
+            self._compact(event)
 
-    def listeners(self, event: str) -> Iterable[Subscriber]:
+    def _compact(self, event: str) -> None:
         with self._lock:
-            return tuple(self._subscribers.get(event, ()))
+            callbacks = self._subscribers.get(event)
+            if not callbacks:
+                return
+            alive = tuple(
+                cb for cb in callbacks if type(cb) is not weakref.WeakMethod or cb() is not None
+            )
+            if alive:
+                self._subscribers[event] = alive
+            else:
+                self._subscribers.pop(event, None)
+
+    def listeners(self, event: str) -> Iterable[Subscriber]:
+        resolved = []
+        for callback in self._subscribers.get(event, _EMPTY):
+            if type(callback) is weakref.WeakMethod:
+                callback = callback()
+                if callback is None:
+                    continue
+            resolved.append(callback)
+        return tuple(resolved)
 
 
 # Global bus used by legacy convenience helpers
@@ -10,6 +10,7 @@ import base64
 import io
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Iterable, Optional, Tuple
 
 from PIL import Image
@@ -80,9 +81,7 @@ def _load_image(data: bytes, source: Optional[str] = None) -> Optional[Image.Ima
     try:
         with Image.open(io.BytesIO(data)) as img:
             converted = img.convert("RGBA")
-        logger.debug(
-            "[CoverArt] Loaded embedded image",
-        )
+        logger.debug("[CoverArt] Loaded embedded image")
         return converted
     except Exception as exc:  # pragma: no cover
         if source:
@@ -92,9 +91,46 @@ def _load_image(data: bytes, source: Optional[str] = None) -> Optional[Image.Ima
         return None
 
 
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=16)
+def _cached_image(path: str, signature: Tuple[int, int]) -> Optional[Image.Image]:
+    """Decoded RGBA artwork for *path*, keyed by file signature so edits invalidate it.
+
+    Callers must treat the image as read-only.
+    """
+
+    art_bytes = _extract_embedded_bytes(path)
+    if not art_bytes:
+        return None
+    return _load_image(art_bytes, source=path)
+
+
+def clear_coverart_cache() -> None:
+    """Drop memoised decoded images (e.g. after a library rescan)."""
+
+    _cached_image.cache_clear()
+
+
 def load_cover_image(path: str) -> Optional[Image.Image]:
-    """Return a PIL image for the first embedded artwork, or ``None``."""
+    """Return a PIL image for the first embedded artwork, or ``None``.
+
+    Results are cached per ``(path, mtime, size)``; the returned image is shared
+    between callers and must not be mutated in place.
+    """
 
+    signature = _file_signature(path)
+    if signature is not None:
+        image = _cached_image(path, signature)
+        if image is None:
+            logger.warning(f"[CoverArt] No embedded artwork found: {path}")
+        return image
     art_bytes = _extract_embedded_bytes(path)
     if not art_bytes:
         logger.warning(f"[CoverArt] No embedded artwork found: {path}")
@@ -102,20 +138,28 @@ def load_cover_image(path: str) -> Optional[Image.Image]:
     return _load_image(art_bytes, source=path)
 
 
+try:  # Pillow >=9
+    _RESAMPLE = Image.Resampling.LANCZOS  # type: ignore[attr-defined]
+except AttributeError:  # pragma: no cover - legacy fallback
+    _RESAMPLE = Image.LANCZOS  # type: ignore[attr-defined]
+
+
 def _resize(image: Image.Image, size: Tuple[int, int]) -> Image.Image:
     """Return a resized copy using high-quality resampling."""
 
-    try:  # Pillow >=9
-        resample = Image.Resampling.LANCZOS  # type: ignore[attr-defined]
-    except AttributeError:  # pragma: no cover - legacy fallback
-        resample = Image.LANCZOS  # type: ignore[attr-defined]
-    return image.resize(size, resample).copy()
+    # resize() already returns a new image; no extra copy needed
+    return image.resize(size, _RESAMPLE)
 
 
 def _encode_png(image: Image.Image) -> str:
     with io.BytesIO() as buffer:
         image.save(buffer, format="PNG")
-        return base64.b64encode(buffer.getvalue()).decode("ascii")
+        # Encode straight from the buffer's memory instead of copying it out with getvalue()
+        view = buffer.getbuffer()
+        try:
+            return base64.b64encode(view).decode("ascii")
+        finally:
+            view.release()
 
 
 def build_cover_art(
@@ -144,7 +188,7 @@ def build_cover_art(
     variants: Dict[str, Image.Image] = {}
     for key, size in sizes.items():
         variants[key] = _resize(original, size)
-        logger.debug(f"[CoverArt] Prepared variant '{key}' at {size}")
+        logger.debug("[CoverArt] Prepared variant '%s' at %s", key, size)
 
     base64_png = None
     if base64_variant and base64_variant in variants:
@@ -163,7 +207,7 @@ def ensure_variants(
 
     result = build_cover_art(path, sizes=sizes, base64_variant=base64_variant)
     if not result.has_art:
-        logger.debug(f"[CoverArt] No art assets generated for {path}")
+        logger.debug("[CoverArt] No art assets generated for %s", path)
     return result
 
 
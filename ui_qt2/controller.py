@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import base64
+import io
 import random
 import json
 import os
@@ -9,14 +10,15 @@ import datetime as _dt
 from pathlib import Path
 from typing import Tuple, Optional
 
-from PySide6 import QtCore
+from PySide6 import QtCore, QtGui
 
 from config.settings import Settings
 from tracord.core.events import EventTopic, emit_event
 from ui_qt2.main_window import MainWindow
 from ui_qt2.panels.now_playing_panel import NowPlayingPanel
 from ui_qt2.panels.song_requests_popup import SongRequestsPopup
-from utils.logger import get_logger
+from ui_qt2.signals import get_event_hub
+from utils.logger import get_logger, log_success
 from services.web_overlay import WebOverlayServer
 from utils.stats import load_stats, reset_global_stats, reset_session_stats, increment_song_play
 from utils.traktor import refresh_collection_json, load_collection_json
@@ -32,6 +34,34 @@ from main import DJBot
 logger = get_logger(__name__)
 
 
+class _CoverDecodeTask(QtCore.QRunnable):
+    """Decode base64 cover art off the GUI thread and hand the images back via the hub."""
+
+    def __init__(self, request_id: str, cover_b64: str, want_pil: bool) -> None:
+        super().__init__()
+        self._request_id = request_id
+        self._cover_b64 = cover_b64
+        self._want_pil = want_pil
+
+    def run(self) -> None:
+        image: QtGui.QImage | None = None
+        pil_img = None
+        try:
+            cover_bytes = base64.b64decode(self._cover_b64)
+            decoded = QtGui.QImage.fromData(cover_bytes)
+            if not decoded.isNull():
+                image = decoded
+                if self._want_pil:
+                    from PIL import Image as _PILImage
+
+                    with _PILImage.open(io.BytesIO(cover_bytes)) as src:
+                        pil_img = src.convert("RGBA")
+        except Exception:
+            image = None
+            pil_img = None
+        get_event_hub().coverArtReady.emit(self._request_id, (image, pil_img))
+
+
 class QtController(QtCore.QObject):
     def __init__(self, window: MainWindow) -> None:
         super().__init__(window)
@@ -55,6 +85,9 @@ class QtController(QtCore.QObject):
         # One-time hints/flags
         self._sr_notify_missing_warned = False
         self._discord_connecting = False
+        # Latest cover decode request; stale results from earlier songs are dropped
+        self._cover_request = 0
+        get_event_hub().coverArtReady.connect(self._on_cover_art_ready)
 
         # Populate UI on startup
         self.push_stats_update()
@@ -90,20 +123,16 @@ class QtController(QtCore.QObject):
             self.window.now_playing_panel.set_track_fields(artist, title, album, extra)
         else:
             self.window.now_playing_panel.set_track_info("No track info available")
-        # Cover art
+        # Cover art is decoded on the thread pool; the panel keeps the previous cover
+        # until _on_cover_art_ready swaps it in.
+        self._cover_request += 1
         cover_b64 = payload.get("coverart_base64")
-        pm = None
         if isinstance(cover_b64, str) and cover_b64:
-            try:
-                from PySide6 import QtGui
-
-                data = base64.b64decode(cover_b64)
-                pixmap = QtGui.QPixmap()
-                if pixmap.loadFromData(data):
-                    pm = pixmap
-            except Exception:
-                pm = None
-        self.window.now_playing_panel.set_cover_pixmap(pm)
+            QtCore.QThreadPool.globalInstance().start(
+                _CoverDecodeTask(str(self._cover_request), cover_b64, self._spout is not None)
+            )
+        else:
+            self._apply_cover(None, None)
 
         # Check if this song matches a pending request and notify
         try:
@@ -111,32 +140,36 @@ class QtController(QtCore.QObject):
         except Exception as e:
             logger.debug(f"Request-played check skipped: {e}")
 
+        # Fire MIDI on song change if enabled
+        try:
+            if self._midi and self._midi.enabled:
+                self._midi.send_song_change()
+        except Exception:
+            # Any MIDI errors are handled in helper; keep UI responsive
+            pass
+
+    @QtCore.Slot(str, object)
+    def _on_cover_art_ready(self, request_id: str, result: object) -> None:
+        if request_id != str(self._cover_request):
+            return
+        image, pil_img = result  # type: ignore[misc]
+        self._apply_cover(image, pil_img)
+
+    def _apply_cover(self, image: QtGui.QImage | None, pil_img) -> None:
+        pm = QtGui.QPixmap.fromImage(image) if image is not None else None
+        self.window.now_playing_panel.set_cover_pixmap(pm)
+
         # Send cover art via Spout if enabled; if no cover, push a transparent frame to clear previous image
         try:
             if self._spout:
-                from PIL import Image as _PILImage
-                pil_img = None
-                if pm is not None:
-                    from PySide6 import QtGui
-                    img = pm.toImage()
-                    if not img.isNull():
-                        from PIL.ImageQt import fromqimage as pil_fromqimage
-                        pil_img = pil_fromqimage(img).convert("RGBA")
                 if pil_img is None:
+                    from PIL import Image as _PILImage
                     pil_img = _PILImage.new("RGBA", (SPOUT_SIZE, SPOUT_SIZE), (0, 0, 0, 0))
                 self._spout.send_pil_image(pil_img)
         except Exception:
             # Avoid UI disruption if spout conversion fails
             pass
 
-        # Fire MIDI on song change if enabled
-        try:
-            if self._midi and self._midi.enabled:
-                self._midi.send_song_change()
-        except Exception:
-            # Any MIDI errors are handled in helper; keep UI responsive
-            pass
-
     def push_stats_update(self) -> None:
         try:
             stats = load_stats()
@@ -571,7 +604,7 @@ class QtController(QtCore.QObject):
             except Exception:
                 pass
 
-            logger.info(f"Discord bot ready: {bot_name}")
+            log_success(logger, f"Discord bot ready: {bot_name}")
             self._refresh_bot_button()
         except Exception:
             pass
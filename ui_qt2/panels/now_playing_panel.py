@@ -53,6 +53,27 @@ class NowPlayingPanel(QtWidgets.QGroupBox):
     toggledMidi = QtCore.Signal(bool)
     overlayRequested = QtCore.Signal()
 
+    # Role fonts, built lazily on first panel creation (needs a QApplication)
+    _ARTIST_FONT: QtGui.QFont | None = None
+    _TITLE_FONT: QtGui.QFont | None = None
+    _ALBUM_FONT: QtGui.QFont | None = None
+    _EXTRA_FONT: QtGui.QFont | None = None
+
+    @classmethod
+    def _ensure_role_fonts(cls) -> None:
+        if cls._ARTIST_FONT is not None:
+            return
+        family = QtWidgets.QApplication.font().family()
+        # Artist: large bold
+        f_artist = QtGui.QFont(family, 20); f_artist.setBold(True)
+        # Title: medium semibold
+        f_title = QtGui.QFont(family, 18); f_title.setWeight(QtGui.QFont.Weight.Medium)
+        # Album: small italic
+        f_album = QtGui.QFont(family, 16); f_album.setItalic(True)
+        # Extra: small normal
+        f_extra = QtGui.QFont(family, 14)
+        cls._ARTIST_FONT, cls._TITLE_FONT, cls._ALBUM_FONT, cls._EXTRA_FONT = f_artist, f_title, f_album, f_extra
+
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__("Now Playing", parent)
         layout = QtWidgets.QGridLayout(self)
@@ -101,15 +122,12 @@ class NowPlayingPanel(QtWidgets.QGroupBox):
         # Only the extra label should wrap
         self.extra_label.setWordWrap(True)
 
-        # Default fonts (you can tweak these)
-        # Artist: large bold
-        f_artist = self.artist_label.font(); f_artist.setPointSize(20); f_artist.setBold(True); self.artist_label.setFont(f_artist)
-        # Title: medium semibold
-        f_title = self.title_label.font(); f_title.setPointSize(18); f_title.setWeight(QtGui.QFont.Weight.Medium); self.title_label.setFont(f_title)
-        # Album: small italic
-        f_album = self.album_label.font(); f_album.setPointSize(16); f_album.setItalic(True); self.album_label.setFont(f_album)
-        # Extra: small normal
-        f_extra = self.extra_label.font(); f_extra.setPointSize(14); self.extra_label.setFont(f_extra)
+        # Shared per-role fonts (built once per process)
+        self._ensure_role_fonts()
+        self.artist_label.setFont(NowPlayingPanel._ARTIST_FONT)
+        self.title_label.setFont(NowPlayingPanel._TITLE_FONT)
+        self.album_label.setFont(NowPlayingPanel._ALBUM_FONT)
+        self.extra_label.setFont(NowPlayingPanel._EXTRA_FONT)
 
         info_layout.addWidget(self.artist_label)
         info_layout.addWidget(self.title_label)
@@ -2,12 +2,26 @@
 from __future__ import annotations
 
 import json
+import os
+from operator import itemgetter
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Iterator, Tuple
 
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
 from shiboken6 import isValid
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
 from config.settings import Settings
 from tracord.core.events import EventTopic, emit_event
 from ui_qt2.signals import get_event_hub
@@ -15,10 +29,227 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+RequestRow = Tuple[int, str, str, str, str, str, str]
+
+
+def _read_requests_json(path: Path) -> Any:
+    """Read and parse *path* with a single open/read; both parsers accept the raw UTF-8 bytes."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+    return _loads(data)
+
+
+def _iter_request_items(path: Path) -> Iterator[dict]:
+    """Yield request objects from the JSON array at *path*, streaming when ijson is available."""
+    if ijson is not None:
+        with open(path, "rb") as f:
+            yield from ijson.items(f, "item", use_float=True)
+        return
+    items = _read_requests_json(path)
+    if isinstance(items, list):
+        yield from items
+
+
+def _row_from_item(idx: int, item: dict) -> RequestRow:
+    """Build a display row from a stored request; *idx* is the fallback request number."""
+    rn = item.get("RequestNumber")
+    try:
+        rn_int = int(rn) if rn is not None else idx
+    except Exception:
+        rn_int = idx
+    date_str = str(item.get("Date", ""))
+    time_str = str(item.get("Time", ""))
+    user = str(item.get("User", ""))
+    artist = str(item.get("Artist", ""))
+    title = str(item.get("Title", ""))
+    album = str(item.get("Album", "")).strip()
+    if album:
+        title = f"{title} [{album}]" if title else f"[{album}]"
+    if not (artist and title):
+        song = str(item.get("Song", ""))
+        if " - " in song:
+            artist, title = [p.strip() for p in song.split(" - ", 1)]
+        else:
+            artist, title = "", song
+    bpm = str(item.get("Bpm", item.get("BPM", "")))
+    return (rn_int, date_str, time_str, user, bpm, artist, title)
+
+
+class _WriteSignals(QtCore.QObject):
+    """Carries a finished write's file signature and contents back to the GUI thread."""
+
+    written = QtCore.Signal(object, object)
+
+
+# Single worker so request-file writes land in the order they were submitted
+_WRITE_POOL: QtCore.QThreadPool | None = None
+# Signature of the file right after the worker's last successful write (worker thread only)
+_last_written_sig: tuple[int, int] | None = None
+
+
+def _write_pool() -> QtCore.QThreadPool:
+    global _WRITE_POOL
+    if _WRITE_POOL is None:
+        _WRITE_POOL = QtCore.QThreadPool()
+        _WRITE_POOL.setMaxThreadCount(1)
+    return _WRITE_POOL
+
+
+def _file_sig(path: Path) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _without_number(item: dict) -> dict:
+    return {k: v for k, v in item.items() if k != "RequestNumber"}
+
+
+class _WriteRequestsTask(QtCore.QRunnable):
+    """Persist a popup deletion off the GUI thread, then announce it.
+
+    *items* is the list with the deletion applied, built from the file state with
+    signature *base_sig* (None when earlier popup writes were still queued, in which
+    case the worker's own last write is the base). If the file no longer has that
+    signature another writer (e.g. the Discord cog) changed it, so the current file
+    is re-read and *removed* is deleted from it instead.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        items: list[dict],
+        base_sig: tuple[int, int] | None,
+        removed: dict,
+        request_number: int,
+        removed_info: dict[str, Any],
+        signals: _WriteSignals,
+    ) -> None:
+        super().__init__()
+        self._path = path
+        self._items = items
+        self._base_sig = base_sig
+        self._removed = removed
+        self._request_number = request_number
+        self._removed_info = removed_info
+        self._signals = signals
+
+    def _merge_with_file(self) -> list[dict] | None:
+        """Delete the request from the file's current contents; None if it is already gone."""
+        try:
+            items = _read_requests_json(self._path) if self._path.exists() else []
+        except Exception:
+            items = []
+        if not isinstance(items, list):
+            items = []
+        target = _without_number(self._removed)
+        for idx, it in enumerate(items):
+            if isinstance(it, dict) and _without_number(it) == target:
+                items.pop(idx)
+                for j in range(idx, len(items)):
+                    items[j]["RequestNumber"] = j + 1
+                return items
+        return None
+
+    def run(self) -> None:
+        global _last_written_sig
+        expected = self._base_sig if self._base_sig is not None else _last_written_sig
+        items: list[dict] | None = self._items
+        if expected is None or _file_sig(self._path) != expected:
+            items = self._merge_with_file()
+            if items is None:
+                # Someone else removed it first; report the file as it stands
+                try:
+                    current = _read_requests_json(self._path) if self._path.exists() else []
+                except Exception:
+                    current = None
+                self._signals.written.emit(_file_sig(self._path), current if isinstance(current, list) else None)
+                return
+        try:
+            from utils.helpers import safe_write_json
+            safe_write_json(str(self._path), items)
+        except Exception as e:
+            logger.error(f"Failed to delete request #{self._request_number}: {e}")
+            _last_written_sig = None
+            self._signals.written.emit(None, None)
+            return
+        _last_written_sig = _file_sig(self._path)
+        self._signals.written.emit(_last_written_sig, items)
+        info = self._removed_info
+        logger.info(
+            "Song request cleared via popup: #%s | %s | %s - %s",
+            info.get("RequestNumber"),
+            info.get("User"),
+            info.get("Artist"),
+            info.get("Title"),
+        )
+        emit_event(EventTopic.SONG_REQUEST_DELETED, {"RequestNumber": self._request_number})
+
+
+class SongRequestsModel(QtCore.QAbstractTableModel):
+    """Table model over display rows; cells are served from the row tuples without per-cell items."""
+
+    _HEADERS = ("", "#", "Date", "Time", "User", "BPM", "Artist", "Title")
+
+    def __init__(self, clear_icon: QtGui.QIcon, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._rows: list[RequestRow] = []
+        self._clear_icon = clear_icon
+
+    def set_rows(self, rows: list[RequestRow]) -> None:
+        if rows == self._rows:
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def request_number(self, row: int) -> int:
+        return self._rows[row][0]
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole) -> Any:  # type: ignore[override]
+        if not index.isValid():
+            return None
+        col = index.column()
+        if col == 0:
+            if role == QtCore.Qt.ItemDataRole.DecorationRole:
+                return self._clear_icon
+            if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+                return "Clear request"
+            return None
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return str(self._rows[index.row()][col - 1])
+        return None
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.ItemDataRole.DisplayRole) -> Any:  # type: ignore[override]
+        if orientation == QtCore.Qt.Orientation.Horizontal and role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self._HEADERS[section]
+        return None
+
 
 class SongRequestsPopup(QtWidgets.QDialog):
     """Small, always-on-top popup showing requests with a one-click clear action."""
 
+    # Clear-action icon shared by every row and every popup instance
+    _CLEAR_ICON: QtGui.QIcon | None = None
+
+    def _clear_icon(self) -> QtGui.QIcon:
+        if SongRequestsPopup._CLEAR_ICON is None:
+            SongRequestsPopup._CLEAR_ICON = self.style().standardIcon(
+                QtWidgets.QStyle.StandardPixmap.SP_DialogApplyButton
+            )
+        return SongRequestsPopup._CLEAR_ICON
+
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("Song Requests")
@@ -29,15 +260,17 @@ class SongRequestsPopup(QtWidgets.QDialog):
 
         layout = QtWidgets.QVBoxLayout(self)
 
-        # Columns: [✓], #, Date, Time, User, BPM, Artist, Title
-        self.table = QtWidgets.QTableWidget(0, 8)
-        self.table.setHorizontalHeaderLabels(["", "#", "Date", "Time", "User", "BPM", "Artist", "Title"])  # action on the left
+        # Columns: [✓], #, Date, Time, User, BPM, Artist, Title (action on the left)
+        self._model = SongRequestsModel(self._clear_icon(), self)
+        self.table = QtWidgets.QTableView(self)
+        self.table.setModel(self._model)
         self.table.verticalHeader().setVisible(False)
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.NoSelection)
         self.table.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
         self.table.setTextElideMode(QtCore.Qt.TextElideMode.ElideRight)
         self.table.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.table.clicked.connect(self._on_index_clicked)
         layout.addWidget(self.table)
 
         header = self.table.horizontalHeader()
@@ -52,12 +285,27 @@ class SongRequestsPopup(QtWidgets.QDialog):
         header.setSectionResizeMode(7, QtWidgets.QHeaderView.ResizeMode.Stretch)     # title
 
         # React to resize and initial show for proper widths
+        self._last_layout_available = -1
         self._apply_column_layout()
 
+        # Last parsed file signature (mtime_ns, size) and the rows built from it
+        self._cache_sig: tuple[int, int] | None = None
+        self._cached_rows: list[RequestRow] = []
+        # Request list as last loaded or edited here; deletions are applied to this, not the file
+        self._items: list[dict] = []
+        # Deletion writes submitted but not yet confirmed on the GUI thread
+        self._writes_pending = 0
+
+        # Coalesce bursts of add/delete events into a single reload
+        self._reload_timer = QtCore.QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.timeout.connect(self.reload_song_requests)
+
         # Subscribe to events so popup stays in sync
         hub = get_event_hub()
-        hub.songRequestAdded.connect(lambda _payload: self.reload_song_requests())
-        hub.songRequestDeleted.connect(lambda _payload: self.reload_song_requests())
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+        hub.songRequestAdded.connect(self._on_song_request_added, queued)
+        hub.songRequestDeleted.connect(self._on_song_request_deleted, queued)
 
         # Initial load
         self.reload_song_requests()
@@ -129,6 +377,9 @@ class SongRequestsPopup(QtWidgets.QDialog):
         # Prefer actual viewport width; fall back to dialog width minus some padding
         viewport_w = self.table.viewport().width()
         available = viewport_w if viewport_w and viewport_w > 0 else max(300, self.width() - 32)
+        # Skip relayout while the width is effectively unchanged (e.g. during window drags)
+        if abs(available - self._last_layout_available) < 2:
+            return
 
         fixed_total = w_tick + w_num + w_date + w_time + w_bpm
         remaining = max(100, available - fixed_total)
@@ -150,111 +401,132 @@ class SongRequestsPopup(QtWidgets.QDialog):
         h.resizeSection(5, w_bpm)
         h.resizeSection(6, w_artist)
         # Title stretches (section 7)
+        self._last_layout_available = available
+
+    @QtCore.Slot(object)
+    def _on_song_request_added(self, _payload: object) -> None:
+        self._schedule_reload()
+
+    @QtCore.Slot(object)
+    def _on_song_request_deleted(self, _payload: object) -> None:
+        self._schedule_reload()
+
+    def _schedule_reload(self) -> None:
+        if isValid(self._reload_timer):
+            self._reload_timer.start(50)
 
     def reload_song_requests(self) -> None:
         # Guard against callbacks after the widget has been deleted
         if not isValid(self.table):
             return
+        # The file lags behind our own queued writes; keep showing the in-memory list
+        if self._writes_pending:
+            self._set_rows(self._cached_rows)
+            return
         try:
             path = Path(Settings.SONG_REQUESTS_FILE)
-            rows: list[Tuple[int, str, str, str, str, str, str]] = []
-            if path.exists():
-                items = json.loads(path.read_text(encoding="utf-8"))
-                if isinstance(items, list):
-                    for idx, item in enumerate(items, start=1):
-                        rn = item.get("RequestNumber")
-                        try:
-                            rn_int = int(rn) if rn is not None else idx
-                        except Exception:
-                            rn_int = idx
-                        date_str = str(item.get("Date", ""))
-                        time_str = str(item.get("Time", ""))
-                        user = str(item.get("User", ""))
-                        artist = str(item.get("Artist", ""))
-                        title = str(item.get("Title", ""))
-                        album = str(item.get("Album", "")).strip()
-                        if album:
-                            title = f"{title} [{album}]" if title else f"[{album}]"
-                        if not (artist and title):
-                            song = str(item.get("Song", ""))
-                            if " - " in song:
-                                artist, title = [p.strip() for p in song.split(" - ", 1)]
-                            else:
-                                artist, title = "", song
-                        bpm = str(item.get("Bpm", item.get("BPM", "")))
-                        rows.append((rn_int, date_str, time_str, user, bpm, artist, title))
-                    rows.sort(key=lambda r: r[0])
+            items: list[dict] = []
+            rows: list[RequestRow] = []
+            try:
+                st = os.stat(path)
+                sig: tuple[int, int] | None = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                sig = None
+            # Skip re-parsing when the file is unchanged since the last load
+            if sig is not None and sig == self._cache_sig:
+                self._set_rows(self._cached_rows)
+                return
+            if sig is not None:
+                for idx, item in enumerate(_iter_request_items(path), start=1):
+                    items.append(item)
+                    rows.append(_row_from_item(idx, item))
+                rows.sort(key=itemgetter(0))
+            self._cache_sig = sig
+            self._items = items
+            self._cached_rows = rows
             self._set_rows(rows)
         except Exception as e:
             logger.warning(f"Failed to load song requests in popup: {e}")
+            self._cache_sig = None
+            self._items = []
+            self._cached_rows = []
             self._set_rows([])
 
-    def _set_rows(self, rows: list[Tuple[int, str, str, str, str, str, str]]) -> None:
+    def _set_rows(self, rows: list[RequestRow]) -> None:
         if not isValid(self.table):
             return
-        self.table.setRowCount(len(rows))
-        for row_index, (rn, date, time_, user, bpm, artist, title) in enumerate(rows):
-            # Data cells (shifted by one because col 0 is the action)
-            for col_index, value in enumerate((rn, date, time_, user, bpm, artist, title), start=1):
-                item = QtWidgets.QTableWidgetItem(str(value))
-                self.table.setItem(row_index, col_index, item)
-
-            # Action button at far-left
-            actions = QtWidgets.QWidget(self.table)
-            hbox = QtWidgets.QHBoxLayout(actions)
-            hbox.setContentsMargins(4, 0, 4, 0)
-            hbox.setSpacing(6)
-
-            clear_btn = QtWidgets.QToolButton(actions)
-            clear_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_DialogApplyButton))
-            clear_btn.setToolTip("Clear request")
-            clear_btn.setAutoRaise(True)
-            clear_btn.clicked.connect(lambda _, num=rn: self._delete_request(num))
-
-            hbox.addWidget(clear_btn)
-            hbox.addStretch(1)
-            self.table.setCellWidget(row_index, 0, actions)
+        self._model.set_rows(rows)
+
+    def _on_index_clicked(self, index: QtCore.QModelIndex) -> None:
+        if not index.isValid() or index.column() != 0:
+            return
+        self._delete_request(self._model.request_number(index.row()))
 
     def _delete_request(self, request_number: int) -> None:
         try:
             path = Path(Settings.SONG_REQUESTS_FILE)
-            items = []
-            if path.exists():
-                try:
-                    items = json.loads(path.read_text(encoding="utf-8"))
-                except Exception:
-                    items = []
-            # Capture info for logging before removal
-            removed_info = None
-            for it in items:
+            base_sig: tuple[int, int] | None = None
+            if not self._writes_pending:
+                # Re-parse if another writer changed the file since it was last loaded
+                if _file_sig(path) != self._cache_sig:
+                    self.reload_song_requests()
+                base_sig = self._cache_sig
+            # Build each deletion from the in-memory list so back-to-back deletes chain
+            # correctly even while earlier writes are still queued
+            items = list(self._items)
+            # Locate the entry through a RequestNumber index, pop it and renumber the tail
+            idx_map: dict[int, int] = {}
+            for i, it in enumerate(items):
                 try:
-                    if int(it.get("RequestNumber", 0) or 0) == request_number:
-                        removed_info = {
-                            "RequestNumber": request_number,
-                            "User": it.get("User", ""),
-                            "Artist": it.get("Artist", ""),
-                            "Title": it.get("Title", "") or it.get("Song", ""),
-                        }
-                        break
+                    idx_map[int(it.get("RequestNumber", 0) or 0)] = i
                 except Exception:
                     pass
-            # Remove by RequestNumber
-            items = [it for it in items if int(it.get("RequestNumber", 0) or 0) != request_number]
-            # Renumber
-            for idx, it in enumerate(items, start=1):
-                it["RequestNumber"] = idx
-            from utils.helpers import safe_write_json
-            safe_write_json(str(path), items)
-            if removed_info:
-                logger.info(
-                    "Song request cleared via popup: #%s | %s | %s - %s",
-                    removed_info.get("RequestNumber"),
-                    removed_info.get("User"),
-                    removed_info.get("Artist"),
-                    removed_info.get("Title"),
-                )
-            emit_event(EventTopic.SONG_REQUEST_DELETED, {"RequestNumber": request_number})
+            idx = idx_map.get(request_number)
+            if idx is None:
+                self._schedule_reload()
+                return
+            removed = items.pop(idx)
+            removed_info = {
+                "RequestNumber": request_number,
+                "User": removed.get("User", ""),
+                "Artist": removed.get("Artist", ""),
+                "Title": removed.get("Title", "") or removed.get("Song", ""),
+            }
+            # Renumber with copies: a queued write may still be serializing the previous dicts
+            for j in range(idx, len(items)):
+                items[j] = {**items[j], "RequestNumber": j + 1}
+            rows = [_row_from_item(idx, it) for idx, it in enumerate(items, start=1)]
+            rows.sort(key=itemgetter(0))
+            self._items = items
+            self._cached_rows = rows
+            self._set_rows(rows)
+            # Completion is delivered as a queued signal so _cache_sig only changes on this thread
+            signals = _WriteSignals()
+            signals.written.connect(self._on_requests_written, QtCore.Qt.ConnectionType.QueuedConnection)
+            self._writes_pending += 1
+            _write_pool().start(
+                _WriteRequestsTask(path, items, base_sig, removed, request_number, removed_info, signals)
+            )
         except Exception as e:
             logger.error(f"Failed to delete request #{request_number}: {e}")
-        finally:
-            self.reload_song_requests()
\ No newline at end of file
+            self.reload_song_requests()
+
+    @QtCore.Slot(object, object)
+    def _on_requests_written(self, sig: tuple[int, int] | None, items: list[dict] | None) -> None:
+        # Runs on the GUI thread ahead of the SONG_REQUEST_DELETED reload this write triggers.
+        # Writes finish in submission order; once the last one lands, adopt exactly what it
+        # wrote (including any other writer's changes it merged) so that reload can skip
+        # re-reading the file.
+        self._writes_pending = max(0, self._writes_pending - 1)
+        if self._writes_pending:
+            return
+        if sig is None or items is None:
+            self._cache_sig = None
+            self._schedule_reload()
+            return
+        rows = [_row_from_item(idx, it) for idx, it in enumerate(items, start=1)]
+        rows.sort(key=itemgetter(0))
+        self._cache_sig = sig
+        self._items = items
+        self._cached_rows = rows
+        self._set_rows(rows)
@@ -7,6 +7,18 @@ from PySide6 import QtCore, QtWidgets
 
 
 class StatsPanel(QtWidgets.QGroupBox):
+    # (stats key, display label) per section, with the colon baked in
+    _SESSION_FIELDS = (
+        ("session_song_searches", "Searches:"),
+        ("session_song_requests", "Requests:"),
+        ("session_song_plays", "Plays:"),
+    )
+    _TOTAL_FIELDS = (
+        ("total_song_searches", "Searches:"),
+        ("total_song_requests", "Requests:"),
+        ("total_song_plays", "Plays:"),
+    )
+
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__("Stats", parent)
         grid = QtWidgets.QGridLayout(self)
@@ -14,6 +26,8 @@ class StatsPanel(QtWidgets.QGroupBox):
         grid.setVerticalSpacing(6)
 
         self._values: Dict[str, QtWidgets.QLabel] = {}
+        # Last text rendered per key, so unchanged counters skip setText/relayout
+        self._last_text: Dict[str, str] = {}
 
         row = 0
         # Session heading
@@ -21,12 +35,8 @@ class StatsPanel(QtWidgets.QGroupBox):
         session_lbl.setStyleSheet("font-weight: 600; margin-top: 2px;")
         grid.addWidget(session_lbl, row, 0, 1, 2)
         row += 1
-        for key, title in (
-            ("session_song_searches", "Searches"),
-            ("session_song_requests", "Requests"),
-            ("session_song_plays", "Plays"),
-        ):
-            grid.addWidget(QtWidgets.QLabel(title + ":"), row, 0)
+        for key, title in self._SESSION_FIELDS:
+            grid.addWidget(QtWidgets.QLabel(title), row, 0)
             value = QtWidgets.QLabel("0")
             value.setObjectName(f"stat_{key}")
             grid.addWidget(value, row, 1)
@@ -42,12 +52,8 @@ class StatsPanel(QtWidgets.QGroupBox):
         total_lbl.setStyleSheet("font-weight: 600; margin-top: 6px;")
         grid.addWidget(total_lbl, row, 0, 1, 2)
         row += 1
-        for key, title in (
-            ("total_song_searches", "Searches"),
-            ("total_song_requests", "Requests"),
-            ("total_song_plays", "Plays"),
-        ):
-            grid.addWidget(QtWidgets.QLabel(title + ":"), row, 0)
+        for key, title in self._TOTAL_FIELDS:
+            grid.addWidget(QtWidgets.QLabel(title), row, 0)
             value = QtWidgets.QLabel("0")
             value.setObjectName(f"stat_{key}")
             grid.addWidget(value, row, 1)
@@ -57,5 +63,9 @@ class StatsPanel(QtWidgets.QGroupBox):
         grid.setColumnStretch(1, 1)
 
     def update_stats(self, stats: Dict[str, int]) -> None:
+        last_text = self._last_text
         for key, label in self._values.items():
-            label.setText(str(stats.get(key, 0)))
+            new = str(stats.get(key, 0))
+            if last_text.get(key) != new:
+                label.setText(new)
+                last_text[key] = new
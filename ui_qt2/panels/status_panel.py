@@ -7,12 +7,12 @@ from PySide6 import QtCore, QtWidgets
 
 
 class StatusPanel(QtWidgets.QGroupBox):
-    _ENTRIES = [
-        ("discord", "Discord"),
-        ("listener", "Traktor Listener"),
-        ("spout", "Spout"),
-        ("midi", "MIDI"),
-    ]
+    _ENTRIES = (
+        ("discord", "Discord:"),
+        ("listener", "Traktor Listener:"),
+        ("spout", "Spout:"),
+        ("midi", "MIDI:"),
+    )
 
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__("Status", parent)
@@ -24,7 +24,7 @@ class StatusPanel(QtWidgets.QGroupBox):
         self._labels: Dict[str, QtWidgets.QLabel] = {}
         for key, title in self._ENTRIES:
             label = QtWidgets.QLabel("Unknown")
-            form.addRow(f"{title}:", label)
+            form.addRow(title, label)
             self._labels[key] = label
 
     def set_status(self, key: str, text: str, *, color: str | None = None) -> None:
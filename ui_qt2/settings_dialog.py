@@ -2,12 +2,101 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Set
+import os
+from collections import deque
+from typing import Any, Deque, Dict, Sequence, Set, Tuple
 
 from PySide6 import QtCore, QtWidgets
+from shiboken6 import isValid
 
 from config.settings import SETTINGS_PATH
 
+try:
+    from utils.helpers import safe_write_json
+except Exception:
+    safe_write_json = None
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+_SETTINGS_GROUPS: Dict[str, Tuple[str, ...]] = {
+    "Discord": (
+        "DISCORD_TOKEN",
+        "DISCORD_BOT_APP_ID",
+        "DISCORD_BOT_CHANNEL_IDS",
+        "DISCORD_BOT_ADMIN_IDS",
+        "DISCORD_BOT_REQUEST_PLAYED_CHANNEL_ID",
+        "DISCORD_LIVE_NOTIFICATION_ROLES",
+    ),
+    "Traktor": (
+        "TRAKTOR_LOCATION",
+        "TRAKTOR_COLLECTION_FILENAME",
+        "TRAKTOR_BROADCAST_PORT",
+    ),
+    "GUI & Overlay": (
+        "COVER_SIZE",
+        "FADE_STYLE",
+        "FADE_FRAMES",
+        "FADE_DURATION",
+        "SPOUT_BORDER_PX",
+        "SPOUT_COVER_SIZE",
+        "TRACORD_LOG_LEVEL",
+        "TRACORD_LOG_RICH",
+        "DEBUG",
+    ),
+    "MIDI": (
+        "MIDI_DEVICE",
+    ),
+    "Search & Lists": (
+        "NEW_SONGS_DAYS",
+        "MAX_SONGS",
+        "TIMEOUT",
+    ),
+    "Exclusions": (
+        "EXCLUDED_ITEMS",
+    ),
+}
+
+_SETTINGS_DESCRIPTIONS: Dict[str, str] = {
+    "DISCORD_TOKEN": "Discord bot token (keep secret).",
+    "DISCORD_BOT_APP_ID": "Discord Application (Client) ID.",
+    "DISCORD_BOT_CHANNEL_IDS": "Allowed channel IDs for commands, comma-separated.",
+    "DISCORD_BOT_ADMIN_IDS": "Admin user IDs, comma-separated.",
+    "DISCORD_BOT_REQUEST_PLAYED_CHANNEL_ID": "Channel ID where 'request played' notifications are sent. Leave empty to disable.",
+    "DISCORD_LIVE_NOTIFICATION_ROLES": "Role names/IDs to mention for live notifications, comma-separated.",
+    "TRAKTOR_LOCATION": "Path to the parent folder that contains 'Traktor X.X.X' subfolders.",
+    "TRAKTOR_COLLECTION_FILENAME": "Collection filename (usually collection.nml).",
+    "TRAKTOR_BROADCAST_PORT": "Port used by Traktor broadcast (match Traktor settings).",
+    "COVER_SIZE": "Cover art size for UI/overlay base64 variant (px).",
+    "FADE_STYLE": "Cover art transition style: 'fade' (fade to transparent then in) or 'crossfade' (blend old→new).",
+    "FADE_FRAMES": "Number of frames in the transition (higher = smoother).",
+    "FADE_DURATION": "Total transition duration in seconds.",
+    "SPOUT_BORDER_PX": "Transparent border padding around cover art (px).",
+    "SPOUT_COVER_SIZE": "Spout output size (square px).",
+    "TRACORD_LOG_LEVEL": "Global log level. Options: DEBUG, INFO, WARNING, ERROR, CRITICAL.",
+    "TRACORD_LOG_RICH": "Enable Rich console output (prettier logs).",
+    "DEBUG": "Enable extra logging.",
+    "MIDI_DEVICE": "Preferred MIDI output device name (exact or partial match).",
+    "NEW_SONGS_DAYS": "Days back for 'new songs' listing.",
+    "MAX_SONGS": "Maximum items for certain listings.",
+    "TIMEOUT": "Timeout (seconds) for interactive selections.",
+    "EXCLUDED_ITEMS": "JSON object with DIR/FILE substrings to ignore (advanced).",
+}
+
+# Last parsed settings.json keyed by its (mtime_ns, size) signature
+_settings_cache: tuple[tuple[int, int], Dict[str, Any]] | None = None
+
 
 class SettingsDialog(QtWidgets.QDialog):
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
@@ -18,6 +107,8 @@ class SettingsDialog(QtWidgets.QDialog):
 
         self._widgets: dict[str, QtWidgets.QWidget] = {}
         self._data: Dict[str, Any] = {}
+        # Keys whose editor was changed by the user; only these are re-read on save
+        self._dirty: Set[str] = set()
 
         main_layout = QtWidgets.QVBoxLayout(self)
         main_layout.setContentsMargins(12, 12, 12, 12)
@@ -40,16 +131,38 @@ class SettingsDialog(QtWidgets.QDialog):
         btn_box.rejected.connect(self.reject)
         main_layout.addWidget(btn_box, 0)
 
-        # Load data and build form
+        # Load data now; the form itself is built after the first paint (see showEvent)
         self._load()
-        self._build_grouped_form(inner)
+        self._form_container = inner
+        self._form_built = False
+
+    def showEvent(self, event):  # type: ignore[override]
+        super().showEvent(event)
+        if not self._form_built:
+            self._form_built = True
+            # Context object: the call is dropped if the dialog is destroyed first
+            QtCore.QTimer.singleShot(0, self, self._build_form_lazy)
+
+    def _build_form_lazy(self) -> None:
+        self._build_grouped_form(self._form_container)
 
     def _load(self) -> None:
+        global _settings_cache
         try:
-            with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
-                self._data = json.load(f)
-        except Exception:
-            self._data = {}
+            st = os.stat(SETTINGS_PATH)
+            sig = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            sig = None
+        if sig is not None and _settings_cache is not None and _settings_cache[0] == sig:
+            # Reopening with an unchanged file: reuse the previous parse
+            self._data = dict(_settings_cache[1])
+        else:
+            try:
+                with open(SETTINGS_PATH, "rb") as f:
+                    self._data = _loads(f.read())
+            except Exception:
+                self._data = {}
+            _settings_cache = (sig, dict(self._data)) if sig is not None else None
         # Ensure optional-but-useful keys exist so they show up in the UI
         self._data.setdefault("TRACORD_LOG_LEVEL", "INFO")
         self._data.setdefault("TRACORD_LOG_RICH", False)
@@ -61,106 +174,78 @@ class SettingsDialog(QtWidgets.QDialog):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(12)
 
-        groups: Dict[str, List[str]] = {
-            "Discord": [
-                "DISCORD_TOKEN",
-                "DISCORD_BOT_APP_ID",
-                "DISCORD_BOT_CHANNEL_IDS",
-                "DISCORD_BOT_ADMIN_IDS",
-                "DISCORD_BOT_REQUEST_PLAYED_CHANNEL_ID",
-                "DISCORD_LIVE_NOTIFICATION_ROLES",
-            ],
-            "Traktor": [
-                "TRAKTOR_LOCATION",
-                "TRAKTOR_COLLECTION_FILENAME",
-                "TRAKTOR_BROADCAST_PORT",
-            ],
-            "GUI & Overlay": [
-                "COVER_SIZE",
-                "FADE_STYLE",
-                "FADE_FRAMES",
-                "FADE_DURATION",
-                "SPOUT_BORDER_PX",
-                "SPOUT_COVER_SIZE",
-                "TRACORD_LOG_LEVEL",
-                "TRACORD_LOG_RICH",
-                "DEBUG",
-            ],
-            "MIDI": [
-                "MIDI_DEVICE",
-            ],
-            "Search & Lists": [
-                "NEW_SONGS_DAYS",
-                "MAX_SONGS",
-                "TIMEOUT",
-            ],
-            "Exclusions": [
-                "EXCLUDED_ITEMS",
-            ],
-        }
-
-        descriptions: Dict[str, str] = {
-            "DISCORD_TOKEN": "Discord bot token (keep secret).",
-            "DISCORD_BOT_APP_ID": "Discord Application (Client) ID.",
-            "DISCORD_BOT_CHANNEL_IDS": "Allowed channel IDs for commands, comma-separated.",
-            "DISCORD_BOT_ADMIN_IDS": "Admin user IDs, comma-separated.",
-            "DISCORD_BOT_REQUEST_PLAYED_CHANNEL_ID": "Channel ID where 'request played' notifications are sent. Leave empty to disable.",
-            "DISCORD_LIVE_NOTIFICATION_ROLES": "Role names/IDs to mention for live notifications, comma-separated.",
-            "TRAKTOR_LOCATION": "Path to the parent folder that contains 'Traktor X.X.X' subfolders.",
-            "TRAKTOR_COLLECTION_FILENAME": "Collection filename (usually collection.nml).",
-            "TRAKTOR_BROADCAST_PORT": "Port used by Traktor broadcast (match Traktor settings).",
-            "COVER_SIZE": "Cover art size for UI/overlay base64 variant (px).",
-            "FADE_STYLE": "Cover art transition style: 'fade' (fade to transparent then in) or 'crossfade' (blend old→new).",
-            "FADE_FRAMES": "Number of frames in the transition (higher = smoother).",
-            "FADE_DURATION": "Total transition duration in seconds.",
-            "SPOUT_BORDER_PX": "Transparent border padding around cover art (px).",
-            "SPOUT_COVER_SIZE": "Spout output size (square px).",
-            "TRACORD_LOG_LEVEL": "Global log level. Options: DEBUG, INFO, WARNING, ERROR, CRITICAL.",
-            "TRACORD_LOG_RICH": "Enable Rich console output (prettier logs).",
-            "DEBUG": "Enable extra logging.",
-            "MIDI_DEVICE": "Preferred MIDI output device name (exact or partial match).",
-            "NEW_SONGS_DAYS": "Days back for 'new songs' listing.",
-            "MAX_SONGS": "Maximum items for certain listings.",
-            "TIMEOUT": "Timeout (seconds) for interactive selections.",
-            "EXCLUDED_ITEMS": "JSON object with DIR/FILE substrings to ignore (advanced).",
-        }
-
         seen: Set[str] = set()
+        pending: Deque[tuple[str, Sequence[str]]] = deque()
 
-        def add_group(title: str, keys: List[str]) -> None:
-            box = QtWidgets.QGroupBox(title)
-            form = QtWidgets.QFormLayout(box)
-            form.setLabelAlignment(QtCore.Qt.AlignmentFlag.AlignRight)
-            form.setFormAlignment(QtCore.Qt.AlignmentFlag.AlignTop)
-            for key in keys:
-                if key not in self._data:
-                    continue
-                seen.add(key)
-                value = self._data.get(key)
-                label = QtWidgets.QLabel(key)
-                label.setMinimumWidth(220)
-                tip = descriptions.get(key)
-                if tip:
-                    label.setToolTip(tip)
-
-                widget = self._create_editor_for(key, value)
-                if tip:
-                    widget.setToolTip(tip)  # type: ignore[attr-defined]
-                self._widgets[key] = widget
-                form.addRow(label, widget)
-            if form.rowCount() > 0:
-                layout.addWidget(box)
-
-        # Add configured groups in order
-        for group_title, keys in groups.items():
-            add_group(group_title, keys)
+        # Configured groups in order
+        for group_title, keys in _SETTINGS_GROUPS.items():
+            seen.update(keys)
+            pending.append((group_title, keys))
 
         # Any remaining keys → Other
         remaining = [k for k in sorted(self._data.keys()) if k not in seen]
         if remaining:
-            add_group("Other", remaining)
+            pending.append(("Other", remaining))
+
+        # Build one group per event-loop tick so the dialog stays responsive
+        self._add_groups_queued(layout, pending)
+
+    def _add_groups_queued(
+        self,
+        layout: QtWidgets.QVBoxLayout,
+        pending: Deque[tuple[str, Sequence[str]]],
+    ) -> None:
+        # The dialog may have been closed and deleted between ticks
+        if not (isValid(self) and isValid(layout)):
+            return
+        if not pending:
+            layout.addStretch(1)
+            return
+        title, keys = pending.popleft()
+        self._add_group(layout, title, keys)
+        QtCore.QTimer.singleShot(0, self, lambda: self._add_groups_queued(layout, pending))
 
-        layout.addStretch(1)
+    def _add_group(
+        self,
+        layout: QtWidgets.QVBoxLayout,
+        title: str,
+        keys: Sequence[str],
+    ) -> None:
+        box = QtWidgets.QGroupBox(title)
+        form = QtWidgets.QFormLayout(box)
+        form.setLabelAlignment(QtCore.Qt.AlignmentFlag.AlignRight)
+        form.setFormAlignment(QtCore.Qt.AlignmentFlag.AlignTop)
+        for key in keys:
+            if key not in self._data:
+                continue
+            value = self._data.get(key)
+            label = QtWidgets.QLabel(key)
+            label.setMinimumWidth(220)
+            tip = _SETTINGS_DESCRIPTIONS.get(key)
+            if tip:
+                label.setToolTip(tip)
+
+            widget = self._create_editor_for(key, value)
+            if tip:
+                widget.setToolTip(tip)  # type: ignore[attr-defined]
+            self._widgets[key] = widget
+            self._track_dirty(key, widget)
+            form.addRow(label, widget)
+        if form.rowCount() > 0:
+            layout.addWidget(box)
+
+    def _track_dirty(self, key: str, widget: QtWidgets.QWidget) -> None:
+        mark = lambda *_args, k=key: self._dirty.add(k)
+        if isinstance(widget, QtWidgets.QCheckBox):
+            widget.toggled.connect(mark)
+        elif isinstance(widget, (QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox)):
+            widget.valueChanged.connect(mark)
+        elif isinstance(widget, QtWidgets.QPlainTextEdit):
+            widget.textChanged.connect(mark)
+        elif isinstance(widget, QtWidgets.QComboBox):
+            widget.currentIndexChanged.connect(mark)
+        elif isinstance(widget, QtWidgets.QLineEdit):
+            widget.textEdited.connect(mark)
 
     def _create_editor_for(self, key: str, value: Any) -> QtWidgets.QWidget:
         # Specialized editors
@@ -224,6 +309,9 @@ class SettingsDialog(QtWidgets.QDialog):
         # Build updated data
         updated: Dict[str, Any] = dict(self._data)
         for key, widget in self._widgets.items():
+            # Untouched editors keep their original value from self._data
+            if key not in self._dirty:
+                continue
             if isinstance(widget, QtWidgets.QCheckBox):
                 updated[key] = widget.isChecked()
             elif isinstance(widget, QtWidgets.QSpinBox):
@@ -234,7 +322,7 @@ class SettingsDialog(QtWidgets.QDialog):
                 # Parse JSON text
                 text = widget.toPlainText().strip()
                 try:
-                    updated[key] = json.loads(text) if text else {}
+                    updated[key] = _loads(text) if text else {}
                 except Exception:
                     QtWidgets.QMessageBox.warning(
                         self,
@@ -257,13 +345,11 @@ class SettingsDialog(QtWidgets.QDialog):
 
         # Persist back to settings.json
         try:
-            try:
-                from utils.helpers import safe_write_json
-
+            if safe_write_json is not None:
                 safe_write_json(SETTINGS_PATH, updated, indent=2, ensure_ascii=False)
-            except Exception:
-                with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
-                    json.dump(updated, f, indent=2, ensure_ascii=False)
+            else:
+                with open(SETTINGS_PATH, "wb") as f:
+                    f.write(_dumps(updated))
 
             QtWidgets.QMessageBox.information(
                 self,
@@ -18,11 +18,14 @@ class QtEventHub(QtCore.QObject):
     songRequestAdded = QtCore.Signal(object)
     songRequestDeleted = QtCore.Signal(object)
     logMessage = QtCore.Signal(str, str)
+    # (request id, (QImage | None, PIL image | None)) from off-thread cover decodes
+    coverArtReady = QtCore.Signal(str, object)
 
     def __init__(self) -> None:
         super().__init__()
         self._subs: list[Callable[[], None]] = []
         self._started = False
+        self._emit_song = self.songPlayed.emit
 
     def start(self) -> None:
         if self._started:
@@ -48,15 +51,9 @@ class QtEventHub(QtCore.QObject):
         self._started = False
 
     def _emit(self, signal: QtCore.SignalInstance) -> Callable[[Any], None]:
-        def handler(payload: Any) -> None:
-            # Emit directly; Qt will queue to the receiver's thread if needed
-            try:
-                signal.emit(payload)
-            except Exception:
-                # Fallback to queued invoke if any runtime issue occurs
-                QtCore.QTimer.singleShot(0, lambda: signal.emit(payload))
-
-        return handler
+        # Hand the bound emit straight to the bus; receivers living in the GUI thread
+        # get the call queued by Qt's AutoConnection, so no wrapper or QTimer hop is needed.
+        return signal.emit
 
     # --- Internal handlers to aid diagnostics and unify SONG events ---
     def _on_song_event(self, payload: Any) -> None:
@@ -65,7 +62,7 @@ class QtEventHub(QtCore.QObject):
         except Exception:
             pass
         # Emit directly; queued to main thread automatically if needed
-        self.songPlayed.emit(payload)
+        self._emit_song(payload)
 
     # def _on_traktor_song(self, payload: Any) -> None:
     #     try:
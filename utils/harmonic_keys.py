@@ -20,13 +20,7 @@ def open_key_str_to_int(key_str):
     """Convert Open Key string (e.g., '4d') to Traktor Open Key int."""
     return OPEN_KEY_STR_TO_INT.get(key_str.lower(), None)
 
-def get_compatible_open_keys(key_int):
-    """
-    Given a Traktor Open Key int, return a list of compatible key ints (including self, +/-1, and relative minor/major).
-    Wraps around the wheel as needed.
-    """
-    if not (0 <= key_int < 24):
-        return []
+def _compute_compatible_open_keys(key_int):
     # Determine if major (d) or minor (m)
     is_major = key_int < 12
     base = key_int % 12
@@ -37,10 +31,42 @@ def get_compatible_open_keys(key_int):
     compatible.append((base + 1) % 12 + (0 if is_major else 12))
     # Relative minor/major
     compatible.append((base + (12 if is_major else -12)) % 24)
-    return compatible
+    return tuple(compatible)
+
+# The wheel is fixed, so compatibility is precomputed once per key int
+_COMPAT_BY_INT = tuple(_compute_compatible_open_keys(i) for i in range(24))
+_COMPAT_STRS_BY_INT = tuple(tuple(OPEN_KEY_MAP[j] for j in keys) for keys in _COMPAT_BY_INT)
+
+def _table_index(key_int):
+    """Return *key_int* as a table index (accepting integral floats like 8.0), or None."""
+    try:
+        idx = int(key_int)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    if idx != key_int or not (0 <= idx < 24):
+        return None
+    return idx
+
+def get_compatible_open_keys(key_int):
+    """
+    Given a Traktor Open Key int, return a list of compatible key ints (including self, +/-1, and relative minor/major).
+    Wraps around the wheel as needed.
+    """
+    idx = _table_index(key_int)
+    if idx is not None:
+        return list(_COMPAT_BY_INT[idx])
+    try:
+        in_range = 0 <= key_int < 24
+    except TypeError:
+        return []
+    # Non-integral numbers are not on the table; compute them as before
+    return list(_compute_compatible_open_keys(key_int)) if in_range else []
 
 def get_compatible_open_key_strs(key_int):
     """
     Given a Traktor Open Key int, return a list of compatible Open Key strings.
     """
-    return [open_key_int_to_str(i) for i in get_compatible_open_keys(key_int)]
+    idx = _table_index(key_int)
+    if idx is None:
+        return []
+    return list(_COMPAT_STRS_BY_INT[idx])
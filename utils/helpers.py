@@ -1,38 +1,58 @@
 """
 Permission and utility helper functions
 """
-from typing import Any, Dict, List
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, AbstractSet, Any, Collection, Dict, List
 import os
 import json
 import time
 import errno
-import discord
-from utils.stats import (
-    STATS_FILE, load_stats, save_stats, increment_stat, reset_session_stats, reset_global_stats
-)
+import stat
+import atexit
+import hashlib
+import heapq
+import tempfile
+import threading
+from itertools import islice
+from utils.logger import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import discord
+
+logger = get_logger(__name__)
 
-def wrap_text(text: str, max_length: int, *, ellipsis: str = "…") -> str:
+_ELLIPSIS = "…"
+_ELLIPSIS_LEN = len(_ELLIPSIS)
+
+
+def wrap_text(text: str, max_length: int, *, ellipsis: str = _ELLIPSIS) -> str:
     """Return *text* trimmed to *max_length* characters (including ellipsis)."""
 
+    if len(text) <= max_length:
+        return text if max_length > 0 else ""
     if max_length <= 0:
         return ""
-    if len(text) <= max_length:
-        return text
-    cutoff = max_length - len(ellipsis)
+    cutoff = max_length - (_ELLIPSIS_LEN if ellipsis is _ELLIPSIS else len(ellipsis))
     if cutoff <= 0:
         return ellipsis[:max_length]
-    return text[:cutoff] + ellipsis
+    return f"{text[:cutoff]}{ellipsis}"
+
+def _as_id_set(ids: Collection[int]) -> AbstractSet[int]:
+    # Settings already provides frozensets; only legacy list callers pay for a conversion
+    return ids if isinstance(ids, (set, frozenset)) else frozenset(ids)
+
 
-def check_permissions(user_id: int, allowed_user_ids: List[int]) -> bool:
+def check_permissions(user_id: int, allowed_user_ids: Collection[int]) -> bool:
     """Check if a user has permission based on their ID"""
-    return user_id in allowed_user_ids
+    return user_id in _as_id_set(allowed_user_ids)
 
 
-def check_channel_permissions(interaction: discord.Interaction, channel_ids: List[int]) -> bool:
+def check_channel_permissions(interaction: discord.Interaction, channel_ids: Collection[int]) -> bool:
     """Check if the command is being used in an allowed channel"""
     if not interaction.channel or not channel_ids:
         return False
-    return interaction.channel.id in channel_ids
+    return interaction.channel.id in _as_id_set(channel_ids)
 
 
 def format_song_requests(song_requests: List[dict]) -> str:
@@ -45,25 +65,36 @@ def format_song_requests(song_requests: List[dict]) -> str:
         return "No song requests found."
 
     formatted_requests = []
+    append = formatted_requests.append
+    # Length of the joined response so far; once past Discord's limit the tail would be
+    # clipped anyway, so stop formatting entries.
+    total_len = -1
+    truncated = False
     for entry in song_requests:
-        rn = entry.get("RequestNumber", "?")
-        date = entry.get("Date", "")
-        time = entry.get("Time", "")
-        user = entry.get("User", "")
-        artist = entry.get("Artist")
-        title = entry.get("Title")
-        if artist or title:
-            song_str = f"{artist or ''} | {title or ''}".strip(" |")
+        get = entry.get
+        artist = get("Artist")
+        title = get("Title")
+        if artist and title:
+            song_str = f"{artist} | {title}".strip(" |")
+        elif artist or title:
+            song_str = f"{artist or title}".strip(" |")
         else:
-            song_str = entry.get("Song", "")
+            song_str = get("Song", "")
+        time = get("Time", "")
+        date = get("Date", "")
         dt_part = f"{date} {time}".strip()
-        formatted_requests.append(f"{rn} | {dt_part} | {user} | {song_str}")
+        line = f"{get('RequestNumber', '?')} | {dt_part} | {get('User', '')} | {song_str}"
+        append(line)
+        total_len += len(line) + 1
+        if total_len > 2000:
+            truncated = True
+            break
     response = "\n".join(formatted_requests)
-    
+
     # Ensure the message length doesn't exceed Discord's limit
-    if len(response) > 2000:
+    if truncated:
         response = response[:1958] + "..." + "\nDisplaying oldest requested songs only"
-    
+
     return response
 
 
@@ -74,47 +105,144 @@ def truncate_response(response: str, max_length: int = 2000) -> str:
     return response
 
 
-def update_request_numbers(song_requests):
-    """Update the request numbers in the song requests list"""
-    for i, req in enumerate(song_requests):
-        req["RequestNumber"] = i + 1
+def update_request_numbers(song_requests, start: int = 0):
+    """Update the request numbers in the song requests list.
 
+    Entries before *start* are assumed to be numbered already, so a single deletion
+    only renumbers the tail.
+    """
+    for number, req in enumerate(islice(song_requests, start, None), start + 1):
+        req["RequestNumber"] = number
 
-def safe_write_json(
-    path: str,
-    data: Any,
-    *,
-    indent: int = 2,
-    ensure_ascii: bool = False,
-    retries: int = 3,
-    backoff: float = 0.1,
-) -> None:
-    """Atomically write JSON to disk with optional retry on common Windows locks.
 
-    Strategy:
-    - Write to a temporary file in the same directory
-    - fsync to ensure bytes hit disk
-    - Replace the target (atomic on the same filesystem)
-    - Retry a few times on PermissionError/EBUSY/EPERM/EACCES
-    """
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    tmp_path = path + ".tmp"
+# JSONEncoder instances are stateless once built; reuse one per option combination
+_ENCODERS: Dict[tuple, json.JSONEncoder] = {}
+
+
+def _get_encoder(indent: int, ensure_ascii: bool) -> json.JSONEncoder:
+    key = (indent, ensure_ascii)
+    encoder = _ENCODERS.get(key)
+    if encoder is None:
+        encoder = _ENCODERS[key] = json.JSONEncoder(indent=indent, ensure_ascii=ensure_ascii)
+    return encoder
+
+
+# path -> (sha256 of last payload we wrote, (mtime_ns, size) right after the write)
+_LAST_WRITE: Dict[str, tuple] = {}
+
+
+def _file_signature(path: str) -> tuple | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+# Directories already created by (or known to exist for) safe_write_json
+_ENSURED_DIRS: set = set()
+
+
+def _ensure_dir(directory: str) -> None:
+    if directory and directory not in _ENSURED_DIRS:
+        os.makedirs(directory, exist_ok=True)
+        _ENSURED_DIRS.add(directory)
+
+
+# Directories that can't be opened for fsync (Windows); skip the attempt after the first failure
+_DIR_FSYNC_UNSUPPORTED: set = set()
+
+
+def _fsync_dir(directory: str) -> None:
+    """Flush *directory*'s entries so the preceding rename survives a crash (POSIX)."""
+    if directory in _DIR_FSYNC_UNSUPPORTED:
+        return
+    try:
+        dir_fd = os.open(directory or ".", os.O_RDONLY)
+    except OSError:
+        # Windows can't open directories this way; NTFS journals the rename anyway
+        _DIR_FSYNC_UNSUPPORTED.add(directory)
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def _current_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# mkstemp creates 0600 files; replacements keep the target's mode, new files get the usual default
+_NEW_FILE_MODE = 0o666 & ~_current_umask()
+
+
+def _match_target_mode(fd: int, path: str) -> None:
+    if not hasattr(os, "fchmod"):
+        # Windows: no POSIX permission bits to carry over
+        return
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        mode = _NEW_FILE_MODE
+    try:
+        os.fchmod(fd, mode)
+    except OSError:
+        pass
+
+
+def _write_payload(path: str, payload: bytes, retries: int, backoff: float) -> None:
+    digest = hashlib.sha256(payload).digest()
+    last = _LAST_WRITE.get(path)
+    if last is not None and last[0] == digest and last[1] == _file_signature(path):
+        return
+
+    directory = os.path.dirname(path)
+    _ensure_dir(directory)
+    prefix = os.path.basename(path) + "."
 
     def _attempt_write() -> None:
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
-            f.flush()
-            os.fsync(f.fileno())
-        os.replace(tmp_path, path)
+        # Unique temp name per attempt so concurrent writers never share a temp file
+        # Same directory as the target (cwd for bare names) so os.replace never crosses filesystems
+        fd, tmp_path = tempfile.mkstemp(prefix=prefix, suffix=".tmp", dir=directory or os.curdir)
+        try:
+            try:
+                _match_target_mode(fd, path)
+                # Raw fd writes: no file object, buffer or text encoder in between
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, path)
+            _fsync_dir(directory)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
 
     attempt = 0
     last_err: Exception | None = None
     while attempt < max(1, retries):
         try:
             _attempt_write()
+            _LAST_WRITE[path] = (digest, _file_signature(path))
             return
         except OSError as e:
             last_err = e
+            if isinstance(e, FileNotFoundError) and directory in _ENSURED_DIRS:
+                # Directory vanished since we cached it; recreate and try again
+                _ENSURED_DIRS.discard(directory)
+                _ensure_dir(directory)
+                attempt += 1
+                continue
             if isinstance(e, PermissionError) or e.errno in {errno.EBUSY, errno.EPERM, errno.EACCES}:
                 time.sleep(backoff * (2 ** attempt))
                 attempt += 1
@@ -126,3 +254,126 @@ def safe_write_json(
             break
     if last_err:
         raise last_err
+
+
+# Deferred writes are handled by one lazily started writer thread. Pending entries are
+# path -> (payload, retries, backoff, due, generation); a newer call for the same path
+# replaces the payload, and a write whose generation is no longer current is dropped.
+_pending_writes: Dict[str, tuple] = {}
+# Min-heap of (due, path) for the writer thread; stale entries are skipped when popped
+_due_heap: List[tuple] = []
+_write_generation: Dict[str, int] = {}
+_path_locks: Dict[str, threading.Lock] = {}
+_pending_cond = threading.Condition()
+_writer_thread: threading.Thread | None = None
+
+
+def _next_generation(path: str) -> int:
+    generation = _write_generation.get(path, 0) + 1
+    _write_generation[path] = generation
+    return generation
+
+
+def _write_entry(path: str, entry: tuple) -> None:
+    payload, retries, backoff, _due, generation = entry
+    with _path_locks.setdefault(path, threading.Lock()):
+        if _write_generation.get(path) != generation:
+            return
+        try:
+            _write_payload(path, payload, retries, backoff)
+        except Exception as e:
+            logger.warning(f"Deferred write of {path} failed: {e}")
+
+
+def _writer_loop() -> None:
+    while True:
+        with _pending_cond:
+            while True:
+                if not _due_heap:
+                    _pending_cond.wait()
+                    continue
+                due, path = _due_heap[0]
+                entry = _pending_writes.get(path)
+                if entry is None or entry[3] != due:
+                    # Already flushed or written synchronously since it was scheduled
+                    heapq.heappop(_due_heap)
+                    continue
+                delay = due - time.monotonic()
+                if delay <= 0:
+                    heapq.heappop(_due_heap)
+                    del _pending_writes[path]
+                    break
+                _pending_cond.wait(delay)
+        _write_entry(path, entry)
+
+
+def flush_pending(path: str | None = None) -> None:
+    """Write out deferred ``safe_write_json`` payloads immediately (e.g. on shutdown).
+
+    With *path*, only that file's pending write is flushed.
+    """
+    with _pending_cond:
+        if path is None:
+            entries = list(_pending_writes.items())
+            _pending_writes.clear()
+            _due_heap.clear()
+        else:
+            # Its heap entry goes stale and is skipped by the writer thread
+            entry = _pending_writes.pop(path, None)
+            entries = [(path, entry)] if entry is not None else []
+    for path, entry in entries:
+        _write_entry(path, entry)
+
+
+atexit.register(flush_pending)
+
+
+def safe_write_json(
+    path: str,
+    data: Any,
+    *,
+    indent: int = 2,
+    ensure_ascii: bool = False,
+    retries: int = 3,
+    backoff: float = 0.1,
+    debounce: float = 0.0,
+) -> None:
+    """Atomically write JSON to disk with optional retry on common Windows locks.
+
+    Strategy:
+    - Write to a uniquely named temporary file in the same directory
+    - fsync to ensure bytes hit disk
+    - Replace the target (atomic on the same filesystem)
+    - Retry a few times on PermissionError/EBUSY/EPERM/EACCES
+    - Skip the whole write when the payload matches what we last wrote and the
+      file has not been touched since
+
+    With ``debounce`` > 0 the data is serialized in the caller's thread and the disk
+    write happens on a shared writer thread that many seconds later, so bursts of
+    calls for the same path collapse into one write of the latest data (used by the
+    stats counters). Use ``flush_pending()`` to force deferred writes out.
+    """
+    global _writer_thread
+    # Serialize once up front so each attempt is a single unbuffered write() call;
+    # deferred writes keep the bytes, so later mutation of ``data`` can't leak in.
+    payload = _get_encoder(indent, ensure_ascii).encode(data).encode("utf-8")
+    if debounce <= 0:
+        with _pending_cond:
+            _next_generation(path)
+            _pending_writes.pop(path, None)
+        with _path_locks.setdefault(path, threading.Lock()):
+            _write_payload(path, payload, retries, backoff)
+        return
+
+    with _pending_cond:
+        existing = _pending_writes.get(path)
+        if existing is not None:
+            due = existing[3]
+        else:
+            due = time.monotonic() + max(0.0, debounce)
+            heapq.heappush(_due_heap, (due, path))
+        _pending_writes[path] = (payload, retries, backoff, due, _next_generation(path))
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(target=_writer_loop, name="JsonWriter", daemon=True)
+            _writer_thread.start()
+        _pending_cond.notify()
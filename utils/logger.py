@@ -2,11 +2,18 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Optional
 
 
 BASE_LOGGER = logging.getLogger("tracord")
 GUI_SUCCESS_MARKERS = ["✅", "🟢", "ready", "success", "complete"]
+# One scan over the message instead of a substring search per marker
+_MARKER_RE = re.compile("|".join(re.escape(marker) for marker in GUI_SUCCESS_MARKERS))
+# Success lines are tagged explicitly via log_success(). Set True to also sniff untagged
+# INFO records for the markers above (e.g. third-party libraries' log lines).
+GUI_SCAN_SUCCESS_MARKERS = False
+_SUCCESS_EXTRA = {"gui_level": "success"}
 _gui_handler: Optional["GuiHandler"] = None
 
 
@@ -29,14 +36,30 @@ class GuiHandler(logging.Handler):
             self.handleError(record)
 
 
+# GUI tag per standard level; custom levels fall back to the threshold ladder
+_GUI_LEVELS = {
+    logging.DEBUG: "info",
+    logging.INFO: "info",
+    logging.WARNING: "warning",
+    logging.ERROR: "error",
+    logging.CRITICAL: "error",
+}
+
+
 def _map_record_to_gui_level(record: logging.LogRecord, message: str) -> str:
-    if record.levelno >= logging.ERROR:
-        return "error"
-    if record.levelno >= logging.WARNING:
-        return "warning"
-    if record.levelno == logging.INFO and any(marker in message for marker in GUI_SUCCESS_MARKERS):
-        return "success"
-    return "info"
+    levelno = record.levelno
+    gui_level = _GUI_LEVELS.get(levelno)
+    if gui_level is None:
+        if levelno >= logging.ERROR:
+            return "error"
+        return "warning" if levelno >= logging.WARNING else "info"
+    if levelno == logging.INFO:
+        tagged = record.__dict__.get("gui_level")
+        if tagged is not None:
+            return tagged
+        if GUI_SCAN_SUCCESS_MARKERS and _MARKER_RE.search(message) is not None:
+            return "success"
+    return gui_level
 
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
@@ -49,6 +72,12 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     return logging.getLogger(f"tracord.{name}")
 
 
+def log_success(logger: logging.Logger, message: str, *args) -> None:
+    """Log *message* at INFO, tagged as a success for the GUI log panel."""
+
+    logger.info(message, *args, extra=_SUCCESS_EXTRA, stacklevel=2)
+
+
 def set_debug_mode(enabled: bool) -> None:
     """Enable or disable debug logging for the tracord logger hierarchy."""
 
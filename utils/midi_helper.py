@@ -4,9 +4,11 @@ MIDI helper for TraCord DJ: optional MIDI out for song change events and MIDI cl
 Uses mido (with python-rtmidi backend) if available.
 """
 
+import queue
+import random
 import threading
 import time
-from collections import deque
+from array import array
 from typing import Callable, Optional
 
 from utils.logger import get_logger
@@ -18,6 +20,15 @@ except ImportError:
     mido = None
     MIDI_AVAILABLE = False
 
+try:
+    import rtmidi
+except ImportError:
+    rtmidi = None
+
+_MIDI_CLOCK = 0xF8
+_MIDI_START = 0xFA
+_MIDI_CONTINUE = 0xFB
+
 logger = get_logger(__name__)
 
 
@@ -29,10 +40,15 @@ class MidiClockListener:
         self.min_emit_interval = max(0.1, min_emit_interval)
         self.on_bpm = on_bpm
         self._port = None
+        self._rtmidi_in = None
         self._enabled = False
-        self._times = deque(maxlen=self.window)
+        # Ring buffer of recent tick timestamps: _head is the next slot, _filled the live count
+        self._times = array('d', bytes(8 * self.window))
+        self._head = 0
+        self._filled = 0
         self._last_ts = 0.0
-        self._current_bpm: Optional[float] = None
+        # Last emitted BPM in integer tenths (deciBPM); None when no clock is present
+        self._current_deci: Optional[int] = None
         self._stop = threading.Event()
         self._watchdog_thread: Optional[threading.Thread] = None
         self._tick_count = 0
@@ -43,6 +59,11 @@ class MidiClockListener:
         self._last_emit_ts = 0.0
         self._last_bpm_log_ts = 0.0
         self._smoothed_bpm: Optional[float] = None
+        # EMA weight for each new BPM sample; the previous estimate decays by 1 - alpha per tick
+        self._alpha = 0.25
+        # Realtime handlers keyed by mido message type and by raw status byte (rtmidi path)
+        self._dispatch = {"clock": self._on_clock, "start": self._reset_ring, "continue": self._reset_ring}
+        self._raw_dispatch = {_MIDI_CLOCK: self._on_clock, _MIDI_START: self._reset_ring, _MIDI_CONTINUE: self._reset_ring}
 
     def _select_input_port(self):
         ports = mido.get_input_names()
@@ -58,49 +79,104 @@ class MidiClockListener:
         return ports[0] if ports else None
 
     def _handle_message(self, msg):
-        if not msg or msg.type != "clock":
-            return
-        now = time.monotonic()
-        self._times.append(now)
+        handler = self._dispatch.get(msg.type) if msg else None
+        if handler is not None:
+            handler()
+
+    def _raw_cb(self, event, _data=None):
+        # python-rtmidi callback: event is (message bytes, delta); no mido.Message is built
+        message = event[0]
+        if message:
+            handler = self._raw_dispatch.get(message[0])
+            if handler is not None:
+                handler()
+
+    def _reset_ring(self):
+        # Transport (re)started: the pause before it must not count as a clock interval
+        self._head = 0
+        self._filled = 0
+
+    def _open_rtmidi_input(self, port_name: str):
+        """Open *port_name* with python-rtmidi directly, or return None to fall back to mido."""
+        if rtmidi is None:
+            return None
+        midi_in = None
+        try:
+            midi_in = rtmidi.MidiIn()
+            ports = midi_in.get_ports()
+            if port_name not in ports:
+                midi_in.delete()
+                return None
+            midi_in.ignore_types(sysex=False, timing=False, active_sense=False)
+            midi_in.open_port(ports.index(port_name))
+            midi_in.set_callback(self._raw_cb)
+            return midi_in
+        except Exception as e:
+            logger.debug("MIDI clock listener: rtmidi fast path unavailable (%s); using mido", e)
+            if midi_in is not None:
+                try:
+                    midi_in.delete()
+                except Exception:
+                    pass
+            return None
+
+    def _on_clock(self, _monotonic=time.monotonic):
+        # Runs on the MIDI callback thread for every tick; hot attributes are read into locals
+        now = _monotonic()
+        times = self._times
+        window = self.window
+        head = self._head
+        times[head] = now
+        head += 1
+        if head == window:
+            head = 0
+        self._head = head
+        filled = self._filled
+        if filled < window:
+            filled += 1
+            self._filled = filled
         self._last_ts = now
-        self._tick_count += 1
-        if self._tick_count == 1:
-            logger.debug(f"MIDI clock first tick on {self._port_name or 'unknown port'}")
+        tick_count = self._tick_count + 1
+        self._tick_count = tick_count
         # Throttle tick logging: first tick, then every 15s
-        if (self._tick_count == 1) or ((now - self._last_tick_log) >= 15.0):
-            logger.debug(f"MIDI clock tick #{self._tick_count} at {now:.3f}")
+        if tick_count == 1:
+            logger.debug("MIDI clock first tick on %s", self._port_name or "unknown port")
+            logger.debug("MIDI clock tick #%d at %.3f", tick_count, now)
             self._last_tick_log = now
-        if len(self._times) < 3:
-            return
-        # Compute BPM from average interval of recent pulses (24 clocks per quarter)
-        intervals = [self._times[i] - self._times[i - 1] for i in range(1, len(self._times)) if self._times[i] >= self._times[i - 1]]
-        if not intervals:
+        elif (now - self._last_tick_log) >= 15.0:
+            logger.debug("MIDI clock tick #%d at %.3f", tick_count, now)
+            self._last_tick_log = now
+        if filled < 3:
             return
-        avg_interval = sum(intervals) / len(intervals)
-        if avg_interval <= 0:
+        # Compute BPM from average interval of recent pulses (24 clocks per quarter).
+        # Successive deltas telescope, so the mean interval is (newest - oldest) / (n - 1);
+        # head - filled is the oldest slot (a negative index wraps around the ring).
+        span = now - times[head - filled]
+        if span <= 0:
             return
-        # Correct MIDI clock formula: 24 pulses per quarter note
-        bpm = 60.0 / (avg_interval * 24.0)
+        # Correct MIDI clock formula: 24 pulses per quarter note, so
+        # bpm = 60 / (24 * span / (filled - 1)) = 2.5 * (filled - 1) / span
+        bpm = 2.5 * (filled - 1) / span
         # Clamp to reasonable DJ ranges
         if bpm < 60 or bpm > 330:
             return
 
-        # Smooth with EMA to reduce single-tick jitter
+        # Smooth with EMA to reduce single-tick jitter; the watchdog thread emits the result
         if self._smoothed_bpm is None:
             self._smoothed_bpm = bpm
         else:
-            alpha = 0.25  # weight for new sample
-            self._smoothed_bpm = (alpha * bpm) + ((1 - alpha) * self._smoothed_bpm)
-
-        bpm_display = round(self._smoothed_bpm, 1)
-        now = time.monotonic()
+            self._smoothed_bpm += (bpm - self._smoothed_bpm) * self._alpha
 
+    def _maybe_emit(self, smoothed: float, now: float) -> None:
+        deci = int(smoothed * 10 + 0.5)
         # Emit only if change is meaningful and interval passed
-        if (self._current_bpm is None or abs(bpm_display - self._current_bpm) >= 0.5) and (now - self._last_emit_ts) >= self.min_emit_interval:
-            self._current_bpm = bpm_display
+        # 0.5 BPM change threshold == 5 deciBPM, compared as integers
+        if (self._current_deci is None or abs(deci - self._current_deci) >= 5) and (now - self._last_emit_ts) >= self.min_emit_interval:
+            self._current_deci = deci
+            bpm_display = deci / 10.0
             self._last_emit_ts = now
             if (self._last_bpm_log_ts == 0.0) or ((now - self._last_bpm_log_ts) >= 15.0):
-                logger.debug(f"MIDI clock BPM updated: {bpm_display}")
+                logger.debug("MIDI clock BPM updated: %s", bpm_display)
                 self._last_bpm_log_ts = now
             if self.on_bpm:
                 try:
@@ -109,15 +185,16 @@ class MidiClockListener:
                     pass
 
     def _watchdog(self):
-        while not self._stop.is_set():
-            time.sleep(0.25)
+        # Event.wait returns True as soon as stop() sets the flag
+        while not self._stop.wait(0.25):
             now = time.monotonic()
             if self._tick_count == 0 and not self._no_tick_logged and (now - self._start_ts) > 3.0:
                 logger.info(f"MIDI clock: no ticks received after 3s on {self._port_name or 'unknown port'}")
                 self._no_tick_logged = True
-            if self._current_bpm is not None and (now - self._last_ts) > self.timeout:
+            if self._current_deci is not None and (now - self._last_ts) > self.timeout:
                 logger.debug("MIDI clock timeout; clearing BPM")
-                self._current_bpm = None
+                self._current_deci = None
+                self._smoothed_bpm = None
                 self._last_emit_ts = now
                 self._last_bpm_log_ts = now
                 if self.on_bpm:
@@ -125,6 +202,11 @@ class MidiClockListener:
                         self.on_bpm(None)
                     except Exception:
                         pass
+                continue
+            # BPM callbacks run here at the watchdog cadence rather than on the MIDI callback thread
+            smoothed = self._smoothed_bpm
+            if smoothed is not None and (now - self._last_ts) <= self.timeout:
+                self._maybe_emit(smoothed, now)
 
     def start(self) -> bool:
         if self._enabled:
@@ -138,23 +220,11 @@ class MidiClockListener:
             return False
         try:
             self._port_name = port_name
-            self._port = mido.open_input(port_name, callback=self._handle_message)
-            # Ensure timing (clock) messages are not filtered by backend defaults
-            ignored_set = False
-            try:
-                # rtmidi backend
-                self._port._port.ignore_types(sysex=False, timing=False, sensing=False)  # type: ignore[attr-defined]
-                ignored_set = True
-            except Exception:
-                try:
-                    self._port._rtmidi.ignore_types(sysex=False, timing=False, sensing=False)  # type: ignore[attr-defined]
-                    ignored_set = True
-                except Exception:
-                    pass
-            if ignored_set:
-                logger.info("MIDI clock listener: timing messages unignored (sysex=False, timing=False, sensing=False)")
+            self._rtmidi_in = self._open_rtmidi_input(port_name)
+            if self._rtmidi_in is not None:
+                logger.info("MIDI clock listener: using python-rtmidi directly (timing messages unignored)")
             else:
-                logger.info("MIDI clock listener: could not adjust ignore_types; relying on backend defaults")
+                self._open_mido_input(port_name)
             self._enabled = True
             self._stop.clear()
             self._start_ts = time.monotonic()
@@ -171,8 +241,28 @@ class MidiClockListener:
             logger.error(f"Failed to open MIDI input port: {e}")
             self._enabled = False
             self._port = None
+            self._rtmidi_in = None
             return False
 
+    def _open_mido_input(self, port_name: str) -> None:
+        self._port = mido.open_input(port_name, callback=self._handle_message)
+        # Ensure timing (clock) messages are not filtered by backend defaults
+        ignored_set = False
+        try:
+            # rtmidi backend
+            self._port._port.ignore_types(sysex=False, timing=False, sensing=False)  # type: ignore[attr-defined]
+            ignored_set = True
+        except Exception:
+            try:
+                self._port._rtmidi.ignore_types(sysex=False, timing=False, sensing=False)  # type: ignore[attr-defined]
+                ignored_set = True
+            except Exception:
+                pass
+        if ignored_set:
+            logger.info("MIDI clock listener: timing messages unignored (sysex=False, timing=False, sensing=False)")
+        else:
+            logger.info("MIDI clock listener: could not adjust ignore_types; relying on backend defaults")
+
     def stop(self) -> None:
         self._stop.set()
         if self._watchdog_thread and self._watchdog_thread.is_alive():
@@ -184,8 +274,16 @@ class MidiClockListener:
         except Exception:
             pass
         self._port = None
+        if self._rtmidi_in is not None:
+            try:
+                self._rtmidi_in.cancel_callback()
+                self._rtmidi_in.close_port()
+                self._rtmidi_in.delete()
+            except Exception:
+                pass
+            self._rtmidi_in = None
         self._enabled = False
-        self._current_bpm = None
+        self._current_deci = None
 
     @property
     def enabled(self) -> bool:
@@ -193,7 +291,7 @@ class MidiClockListener:
 
     @property
     def bpm(self) -> Optional[float]:
-        return self._current_bpm
+        return None if self._current_deci is None else self._current_deci / 10.0
 
 
 class MidiHelper:
@@ -203,6 +301,15 @@ class MidiHelper:
         self.lock = threading.Lock()
         self.error = None
         self.preferred_port_name = preferred_port_name
+        # Validated once; send_song_change copies these instead of building new Messages
+        if MIDI_AVAILABLE:
+            self._tmpl_on = mido.Message('note_on', note=60, velocity=64, channel=0)
+            self._tmpl_off = mido.Message('note_off', note=60, velocity=0, channel=0)
+        else:
+            self._tmpl_on = self._tmpl_off = None
+        # Pulses are (msg_on, msg_off, duration); one worker sends them in order
+        self._pulse_q: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
 
     def enable(self):
         if not MIDI_AVAILABLE:
@@ -254,6 +361,34 @@ class MidiHelper:
                     logger.warning(f"Error closing MIDI port: {e}")
             self.port = None
             self.enabled = False
+        # Drop pulses queued before the port went away
+        try:
+            while True:
+                self._pulse_q.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._pulse_loop, name="MidiPulse", daemon=True)
+            self._worker.start()
+
+    def _pulse_loop(self) -> None:
+        get = self._pulse_q.get
+        while True:
+            msg_on, msg_off, duration = get()
+            port = self.port
+            if not self.enabled or port is None:
+                continue
+            try:
+                port.send(msg_on)
+                logger.info(f"MIDI Note On sent (note={msg_on.note}, ch={msg_on.channel+1}, vel={msg_on.velocity})")
+                time.sleep(duration)
+                port.send(msg_off)
+            except Exception as inner_e:
+                self.error = f"Failed to send MIDI message: {inner_e}"
+                logger.error(self.error)
+                self.disable()
 
     def send_song_change(self, *, note: int = 60, channel: int = 0, duration: float = 0.3) -> None:
         """Send a short Note On/Off pulse (C4 by default) without blocking the UI.
@@ -265,25 +400,11 @@ class MidiHelper:
         if not self.enabled or not self.port:
             return
         try:
-            import random
-
             velocity = random.randint(1, 100)
-            msg_on = mido.Message('note_on', note=note, velocity=velocity, channel=channel)
-            msg_off = mido.Message('note_off', note=note, velocity=0, channel=channel)
-
-            def _send_pulse():
-                try:
-                    import time
-                    self.port.send(msg_on)
-                    logger.info(f"MIDI Note On sent (note={note}, ch={channel+1}, vel={velocity})")
-                    time.sleep(max(0.01, duration))
-                    self.port.send(msg_off)
-                except Exception as inner_e:
-                    self.error = f"Failed to send MIDI message: {inner_e}"
-                    logger.error(self.error)
-                    self.disable()
-
-            threading.Thread(target=_send_pulse, daemon=True).start()
+            msg_on = self._tmpl_on.copy(note=note, velocity=velocity, channel=channel)
+            msg_off = self._tmpl_off.copy(note=note, channel=channel)
+            self._pulse_q.put((msg_on, msg_off, max(0.01, duration)))
+            self._ensure_worker()
         except Exception as e:
             self.error = f"Failed to prepare MIDI message: {e}"
             logger.error(self.error)
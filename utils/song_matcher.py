@@ -1,16 +1,58 @@
 import unicodedata
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+@lru_cache(maxsize=4096)
+def _normalize_str(s: str) -> str:
+    if s.isascii():
+        # NFKC leaves ASCII unchanged and casefold() matches lower() there
+        return s.lower().strip()
+    return unicodedata.normalize('NFKC', s).casefold().strip()
 
 def normalize_string(s):
     """Normalize a string for robust matching: lowercase, strip, and NFKC unicode normalization."""
     if not isinstance(s, str):
         return ''
-    s = unicodedata.normalize('NFKC', s)
-    return s.casefold().strip()
+    return _normalize_str(s)
+
+SongIndex = Dict[Tuple[str, str], Dict[str, Any]]
+
+# (collection list, its length when indexed, index) for the most recently matched collection
+_song_index_cache: Optional[Tuple[List[Dict[str, Any]], int, SongIndex]] = None
+
+def build_song_index(collection) -> SongIndex:
+    """Map normalized (artist, title) to the first matching collection entry."""
+    index: SongIndex = {}
+    for entry in collection:
+        key = (normalize_string(entry.get('artist', '')), normalize_string(entry.get('title', '')))
+        index.setdefault(key, entry)
+    return index
+
+def _get_song_index(collection: List[Dict[str, Any]]) -> SongIndex:
+    global _song_index_cache
+    cached = _song_index_cache
+    if cached is not None and cached[0] is collection and cached[1] == len(collection):
+        return cached[2]
+    index = build_song_index(collection)
+    _song_index_cache = (collection, len(collection), index)
+    return index
+
+def invalidate_song_index() -> None:
+    """Drop the cached match index (call after mutating a collection list in place)."""
+    global _song_index_cache
+    _song_index_cache = None
+
+def preprocess_collection(collection: List[Dict[str, Any]]) -> SongIndex:
+    """Normalize a freshly loaded collection once and cache its match index for later lookups."""
+    invalidate_song_index()
+    return _get_song_index(collection)
 
 def find_song_in_collection(artist, title, collection):
     """Find a song in the collection by normalized artist and title. Returns the matching dict or None."""
     norm_artist = normalize_string(artist)
     norm_title = normalize_string(title)
+    if isinstance(collection, list):
+        return _get_song_index(collection).get((norm_artist, norm_title))
     for entry in collection:
         entry_artist = normalize_string(entry.get('artist', ''))
         entry_title = normalize_string(entry.get('title', ''))
@@ -33,4 +75,4 @@ def get_song_info(artist, title, collection):
             'bpm': '',
             'musical_key': '',
             'audio_file_path': ''
-        }
\ No newline at end of file
+        }
@@ -1,9 +1,11 @@
 # pyright: reportAttributeAccessIssue=false
-from utils.logger import get_logger
+from utils.logger import get_logger, log_success
 logger = get_logger(__name__)
+import ctypes
 import threading
 import time
 import traceback
+from collections import deque
 import SpoutGL
 from PIL import Image
 from config.settings import Settings
@@ -26,6 +28,10 @@ except ImportError:
     gl = None
     SPOUTGL_AVAILABLE = False
 
+# Pixel unpack buffers in the upload ring; a slot is rewritten only after its fence signals
+_PBO_COUNT = 3
+_FRAME_BYTES = SPOUT_SIZE * SPOUT_SIZE * 4
+
 class SpoutGLHelper:
     """
     Helper class to manage a hidden OpenGL context and send PIL images via SpoutGL.
@@ -46,7 +52,14 @@ class SpoutGLHelper:
         self._ready = threading.Event()
         self._sender = None
         self._window = None
-        self._fade_queue = []
+        self._fade_queue = deque()
+        self._incoming = None
+        self._tex_id = None
+        self._transparent = None
+        self._pbos = []
+        self._pbo_ptrs = []
+        self._pbo_fences = []
+        self._pbo_index = 0
 
     def start(self):
         if not SPOUTGL_AVAILABLE:
@@ -58,12 +71,11 @@ class SpoutGLHelper:
         self._thread.start()
         self._ready.wait(timeout=5)
         if self._ready.is_set():
-            logger.info("[SpoutGL] Sender thread started and ready")
+            log_success(logger, "[SpoutGL] Sender thread started and ready")
             # Queue a blank frame so receivers can see the sender immediately
             try:
-                from PIL import Image as _PILImage
                 with self._lock:
-                    self._pending_img = _PILImage.new("RGBA", (SPOUT_SIZE, SPOUT_SIZE), (0, 0, 0, 0))
+                    self._pending_img = self._transparent_frame()
             except Exception:
                 pass
         else:
@@ -83,16 +95,22 @@ class SpoutGLHelper:
     def send_pil_image(self, pil_img):
         if not self._running:
             return
+        # Only hand the image over; the sender thread prepares it, keeping the caller
+        # (the GUI thread) free of resize work. A newer cover replaces an unprepared one.
+        with self._lock:
+            self._incoming = pil_img
+
+    def _queue_frame(self, frame):
         with self._lock:
             if not hasattr(self, '_last_img'):
                 self._last_img = None
             frames = getattr(Settings, 'FADE_FRAMES', 30)
             duration = getattr(Settings, 'FADE_DURATION', 1.0)
             if self._last_img is not None and Settings.FADE_STYLE in ("fade", "crossfade"):
-                self._fade_to_image(self._last_img, pil_img, frames=frames, duration=duration, style=Settings.FADE_STYLE)
+                self._fade_to_image(self._last_img, frame, frames=frames, duration=duration, style=Settings.FADE_STYLE)
             else:
-                self._pending_img = pil_img.copy()
-            self._last_img = pil_img.copy()
+                self._pending_img = frame
+            self._last_img = frame
 
     def _fade_to_image(self, img_from, img_to, frames=30, duration=1.0, style="fade"):
         # frames: total frames for the transition
@@ -103,29 +121,39 @@ class SpoutGLHelper:
         else:  # crossfade or other
             steps = frames
             delay = duration / frames
-        frames_list = []
-        img_from = img_from.convert("RGBA").resize((SPOUT_SIZE, SPOUT_SIZE))
-        img_to = img_to.convert("RGBA").resize((SPOUT_SIZE, SPOUT_SIZE))
+        # Queue (src, dst, alpha) steps; _run blends each frame just before sending it
+        fade_steps = []
+        img_from = _as_spout_frame(img_from)
+        img_to = _as_spout_frame(img_to)
         if style == "fade":
-            transparent = Image.new("RGBA", (SPOUT_SIZE, SPOUT_SIZE), (0, 0, 0, 0))
+            transparent = self._transparent_frame()
             for i in range(steps):
-                alpha = 1 - (i / steps)
-                blended = Image.blend(img_from, transparent, 1 - alpha)
-                frames_list.append(blended.copy())
+                fade_steps.append((img_from, transparent, i / steps))
             for i in range(steps):
-                alpha = (i + 1) / steps
-                blended = Image.blend(transparent, img_to, alpha)
-                frames_list.append(blended.copy())
+                fade_steps.append((transparent, img_to, (i + 1) / steps))
         elif style == "crossfade":
             for i in range(steps + 1):
-                alpha = i / steps
-                blended = Image.blend(img_from, img_to, alpha)
-                frames_list.append(blended.copy())
+                fade_steps.append((img_from, img_to, i / steps))
         else:
-            frames_list.append(img_to.copy())
-        self._fade_queue = frames_list
+            fade_steps.append((img_to, img_to, 1.0))
+        self._fade_queue = deque(fade_steps)
         self._fade_delay = delay
 
+    def _transparent_frame(self):
+        # Shared blank frame; frames are never modified in place, so one instance serves every fade
+        if self._transparent is None:
+            self._transparent = Image.new("RGBA", (SPOUT_SIZE, SPOUT_SIZE), (0, 0, 0, 0))
+        return self._transparent
+
+    @staticmethod
+    def _render_fade_step(step):
+        src, dst, alpha = step
+        if alpha <= 0.0:
+            return src
+        if alpha >= 1.0:
+            return dst
+        return Image.blend(src, dst, alpha)
+
     def _run(self):
         try:
             if not glfw.init(): # type: ignore # type: ignore
@@ -138,6 +166,8 @@ class SpoutGLHelper:
                 glfw.terminate() # type: ignore
                 return
             glfw.make_context_current(self._window) # type: ignore
+            self._create_texture()
+            self._create_pbos()
             self._sender = SpoutSender() # type: ignore
             try:
                 # Some builds require explicit creation with dimensions
@@ -152,15 +182,24 @@ class SpoutGLHelper:
                 logger.warning(f"[SpoutGL] Sender init warning: {e}")
             self._ready.set()
             while self._running:
+                with self._lock:
+                    incoming = self._incoming
+                    self._incoming = None
+                if incoming is not None:
+                    # Border, resize and RGBA conversion happen once per cover, not on every sent frame
+                    self._queue_frame(prepare_spout_frame(incoming, getattr(Settings, 'SPOUT_BORDER_PX', 0)))
                 img = None
+                step = None
                 delay = 0.02
                 with self._lock:
                     if self._fade_queue:
-                        img = self._fade_queue.pop(0)
+                        step = self._fade_queue.popleft()
                         delay = getattr(self, '_fade_delay', 0.08)
                     elif self._pending_img is not None:
                         img = self._pending_img
                         self._pending_img = None
+                if step is not None:
+                    img = self._render_fade_step(step)
                 if img is not None:
                     self._send_image(img)
                     time.sleep(delay)
@@ -170,22 +209,116 @@ class SpoutGLHelper:
             logger.error(f"[SpoutGL] Error in sender thread: {e}\n{traceback.format_exc()}")
         finally:
             self._sender = None
+            self._delete_pbos()
+            if self._tex_id is not None:
+                # Texture belongs to this thread's context, so it must be freed here
+                try:
+                    gl.glDeleteTextures([self._tex_id]) # type: ignore
+                except Exception:
+                    pass
+                self._tex_id = None
             if self._window:
                 glfw.destroy_window(self._window) # type: ignore
                 glfw.terminate() # type: ignore
 
-    def _send_image(self, pil_img):
-        border_px = getattr(Settings, 'SPOUT_BORDER_PX', 0)
-        img = add_spout_border(pil_img, border_px)
-        img_bytes = img.tobytes()
-        # Upload to OpenGL texture
-        tex_id = gl.glGenTextures(1) # type: ignore
-        gl.glBindTexture(gl.GL_TEXTURE_2D, tex_id) # type: ignore
-        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA, SPOUT_SIZE, SPOUT_SIZE, 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, img_bytes) # type: ignore
+    def _create_texture(self):
+        # Allocate the frame texture once; each frame only replaces its pixels
+        self._tex_id = gl.glGenTextures(1) # type: ignore
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self._tex_id) # type: ignore
+        # Immutable storage (GL 4.2 / ARB_texture_storage) when the driver exposes it;
+        # PyOpenGL null functions are falsy when the entry point is missing
+        tex_storage = getattr(gl, "glTexStorage2D", None)
+        allocated = False
+        if tex_storage:
+            try:
+                tex_storage(gl.GL_TEXTURE_2D, 1, gl.GL_RGBA8, SPOUT_SIZE, SPOUT_SIZE) # type: ignore
+                allocated = True
+            except Exception as e:
+                logger.debug("[SpoutGL] glTexStorage2D unavailable (%s); using glTexImage2D", e)
+        if not allocated:
+            gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA, SPOUT_SIZE, SPOUT_SIZE, 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, None) # type: ignore
         gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR) # type: ignore
         gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR) # type: ignore
-        self._sender.sendTexture(tex_id, gl.GL_TEXTURE_2D, SPOUT_SIZE, SPOUT_SIZE, False, 0) # type: ignore
-        gl.glDeleteTextures([tex_id]) # type: ignore
+
+    def _create_pbos(self):
+        # Persistently mapped PBO ring (GL 4.4 / ARB_buffer_storage); without it uploads stay direct
+        buffer_storage = getattr(gl, "glBufferStorage", None)
+        map_range = getattr(gl, "glMapBufferRange", None)
+        fence_sync = getattr(gl, "glFenceSync", None)
+        if not (buffer_storage and map_range and fence_sync):
+            return
+        flags = gl.GL_MAP_WRITE_BIT | gl.GL_MAP_PERSISTENT_BIT | gl.GL_MAP_COHERENT_BIT # type: ignore
+        pbos = []
+        ptrs = []
+        try:
+            pbos = [int(b) for b in gl.glGenBuffers(_PBO_COUNT)] # type: ignore
+            for pbo in pbos:
+                gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, pbo) # type: ignore
+                buffer_storage(gl.GL_PIXEL_UNPACK_BUFFER, _FRAME_BYTES, None, flags) # type: ignore
+                ptr = map_range(gl.GL_PIXEL_UNPACK_BUFFER, 0, _FRAME_BYTES, flags) # type: ignore
+                ptr = getattr(ptr, "value", ptr)
+                if not ptr:
+                    raise RuntimeError("glMapBufferRange returned NULL")
+                ptrs.append(ptr)
+        except Exception as e:
+            logger.debug("[SpoutGL] PBO upload ring unavailable (%s); uploading directly", e)
+            self._pbos = pbos
+            self._pbo_ptrs = ptrs
+            self._delete_pbos()
+            return
+        finally:
+            gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, 0) # type: ignore
+        self._pbos = pbos
+        self._pbo_ptrs = ptrs
+        self._pbo_fences = [None] * len(pbos)
+        self._pbo_index = 0
+
+    def _delete_pbos(self):
+        if not self._pbos:
+            return
+        try:
+            for fence in self._pbo_fences:
+                if fence is not None:
+                    gl.glDeleteSync(fence) # type: ignore
+            # Only the first len(_pbo_ptrs) buffers were mapped
+            for pbo in self._pbos[:len(self._pbo_ptrs)]:
+                gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, pbo) # type: ignore
+                gl.glUnmapBuffer(gl.GL_PIXEL_UNPACK_BUFFER) # type: ignore
+            gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, 0) # type: ignore
+        except Exception:
+            pass
+        try:
+            gl.glDeleteBuffers(len(self._pbos), self._pbos) # type: ignore
+        except Exception:
+            pass
+        self._pbos = []
+        self._pbo_ptrs = []
+        self._pbo_fences = []
+
+    def _upload_frame(self, img_bytes):
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self._tex_id) # type: ignore
+        if not self._pbos or len(img_bytes) != _FRAME_BYTES:
+            gl.glTexSubImage2D(gl.GL_TEXTURE_2D, 0, 0, 0, SPOUT_SIZE, SPOUT_SIZE, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, img_bytes) # type: ignore
+            return
+        i = self._pbo_index
+        fence = self._pbo_fences[i]
+        if fence is not None:
+            # Wait until the GPU has consumed the last upload from this slot
+            gl.glClientWaitSync(fence, gl.GL_SYNC_FLUSH_COMMANDS_BIT, 1_000_000_000) # type: ignore
+            gl.glDeleteSync(fence) # type: ignore
+        ctypes.memmove(self._pbo_ptrs[i], img_bytes, _FRAME_BYTES)
+        gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, self._pbos[i]) # type: ignore
+        # With an unpack buffer bound, the pixels argument is a byte offset into it
+        gl.glTexSubImage2D(gl.GL_TEXTURE_2D, 0, 0, 0, SPOUT_SIZE, SPOUT_SIZE, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, ctypes.c_void_p(0)) # type: ignore
+        gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, 0) # type: ignore
+        self._pbo_fences[i] = gl.glFenceSync(gl.GL_SYNC_GPU_COMMANDS_COMPLETE, 0) # type: ignore
+        self._pbo_index = (i + 1) % len(self._pbos)
+
+    def _send_image(self, pil_img):
+        # Frames arrive prepared by send_pil_image, so this is normally just the byte copy
+        img_bytes = _as_spout_frame(pil_img).tobytes()
+        self._upload_frame(img_bytes)
+        self._sender.sendTexture(self._tex_id, gl.GL_TEXTURE_2D, SPOUT_SIZE, SPOUT_SIZE, False, 0) # type: ignore
 
 def add_spout_border(img, border_px=0):
     if border_px <= 0:
@@ -195,3 +328,14 @@ def add_spout_border(img, border_px=0):
     out = Image.new("RGBA", (SPOUT_SIZE, SPOUT_SIZE), (0, 0, 0, 0))
     out.paste(img_resized, (border_px, border_px))
     return out
+
+def prepare_spout_frame(img, border_px=0):
+    """Return *img* as a bordered SPOUT_SIZE x SPOUT_SIZE RGBA frame ready for upload."""
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
+    return add_spout_border(img, border_px)
+
+def _as_spout_frame(img):
+    if img.mode == "RGBA" and img.size == (SPOUT_SIZE, SPOUT_SIZE):
+        return img
+    return img.convert("RGBA").resize((SPOUT_SIZE, SPOUT_SIZE))
@@ -4,6 +4,7 @@ Stats management utilities for Traktor DJ NowPlaying Discord Bot
 import json
 import os
 import tempfile
+import threading
 from typing import Dict, Any
 
 from config.settings import Settings
@@ -29,15 +30,33 @@ DEFAULT_SESSION_STATS = {
     # Add new session stats here to have them auto-included in session reset
 }
 
-def _ensure_dir(path: str) -> None:
-    try:
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-    except Exception:
-        pass
-
+# In-memory counters per stats file, read from disk once and then authoritative.
+# Counter bumps are saved through safe_write_json's debounce, so a burst collapses
+# into one write _FLUSH_DELAY seconds after the first unsaved change.
+_FLUSH_DELAY = 0.5
+_lock = threading.Lock()
+_STATS: Dict[str, Dict[str, Any]] = {}
 
 def load_stats(stats_file: str = STATS_FILE) -> Dict[str, Any]:
-    """Load stats from disk. If missing or unreadable, return defaults (no overwrite)."""
+    """Return a copy of the current stats, reading the file on first use (defaults if missing)."""
+    with _lock:
+        return dict(_stats_for(stats_file))
+
+def _stats_for(stats_file: str) -> Dict[str, Any]:
+    # Caller holds _lock
+    stats = _STATS.get(stats_file)
+    if stats is None:
+        stats = _STATS[stats_file] = _read_stats(stats_file)
+    return stats
+
+def reload_stats(stats_file: str = STATS_FILE) -> Dict[str, Any]:
+    """Persist unsaved changes, then re-read the stats file (e.g. after editing it by hand)."""
+    flush_stats(stats_file)
+    with _lock:
+        stats = _STATS[stats_file] = _read_stats(stats_file)
+        return dict(stats)
+
+def _read_stats(stats_file: str) -> Dict[str, Any]:
     if not os.path.exists(stats_file):
         return DEFAULT_GLOBAL_STATS.copy()
     try:
@@ -54,44 +73,63 @@ def load_stats(stats_file: str = STATS_FILE) -> Dict[str, Any]:
         logger.warning(f"⚠️ Error loading stats: {e}")
         return DEFAULT_GLOBAL_STATS.copy()
 
-def save_stats(stats: Dict[str, Any], stats_file: str = STATS_FILE) -> None:
+def save_stats(stats: Dict[str, Any], stats_file: str = STATS_FILE, *, debounce: float = 0.0) -> None:
     try:
-        _ensure_dir(stats_file)
         from utils.helpers import safe_write_json
-        safe_write_json(stats_file, stats, indent=2, ensure_ascii=False, retries=3, backoff=0.1)
+        safe_write_json(stats_file, stats, indent=2, ensure_ascii=False, retries=3, backoff=0.1, debounce=debounce)
     except Exception as e:
         logger.warning(f"⚠️ Error saving stats: {e}")
 
 
+def flush_stats(stats_file: str = STATS_FILE) -> None:
+    """Write out debounced stats changes now (deferred writes are also flushed at exit)."""
+    from utils.helpers import flush_pending
+    flush_pending(stats_file)
+
+def _update_stats(stats_file: str, updates: Dict[str, int]) -> Dict[str, Any]:
+    """Apply counter increments in memory and queue a debounced save."""
+    with _lock:
+        stats = _stats_for(stats_file)
+        for name, amount in updates.items():
+            stats[name] = stats.get(name, 0) + amount
+        # Serialized under the lock so queued payloads never go back in time
+        save_stats(stats, stats_file, debounce=_FLUSH_DELAY)
+        snapshot = dict(stats)
+    emit_event(EventTopic.STATS_UPDATED)
+    return snapshot
+
+
 def ensure_stats_initialized(stats_file: str = STATS_FILE) -> None:
-    """Create a default stats file on first launch if it doesn't exist."""
+    """Create a default stats file on first launch if it doesn't exist, and load the counters."""
     if not os.path.exists(stats_file):
         save_stats(DEFAULT_GLOBAL_STATS.copy(), stats_file)
+    with _lock:
+        _stats_for(stats_file)
 
 def increment_stat(stat_name, amount=1, stats_file=STATS_FILE):
-    stats = load_stats(stats_file)
-    stats[stat_name] = stats.get(stat_name, 0) + amount
-    save_stats(stats, stats_file)
-    emit_event(EventTopic.STATS_UPDATED)
-    return stats[stat_name]
+    return _update_stats(stats_file, {stat_name: amount})[stat_name]
 
 def reset_session_stats(stats_file=STATS_FILE):
     """Reset all session stats in the stats file and persist."""
-    stats = load_stats(stats_file)
-    for k, v in DEFAULT_SESSION_STATS.items():
-        if k in stats:
-            old = stats[k]
-            stats[k] = 0
-            logger.info(f"{k}: Reset to 0 (was {old})")
-    save_stats(stats, stats_file)
+    with _lock:
+        stats = _stats_for(stats_file)
+        for k, v in DEFAULT_SESSION_STATS.items():
+            if k in stats:
+                old = stats[k]
+                stats[k] = 0
+                logger.info(f"{k}: Reset to 0 (was {old})")
+        save_stats(stats, stats_file)
+        stats = dict(stats)
     emit_event(EventTopic.STATS_UPDATED)
     return stats
 
 def reset_global_stats(stats_file=STATS_FILE):
     """Reset all global stats to their default values and persist."""
-    before = load_stats(stats_file)
-    save_stats(DEFAULT_GLOBAL_STATS.copy(), stats_file)
-    after = load_stats(stats_file)
+    with _lock:
+        before = _stats_for(stats_file)
+        after = _STATS[stats_file] = DEFAULT_GLOBAL_STATS.copy()
+        save_stats(after, stats_file)
+        after = dict(after)
     for k, v in DEFAULT_GLOBAL_STATS.items():
         if k in before:
             logger.info(f"{k}: Reset to 0 (was {before[k]})")
@@ -100,34 +138,18 @@ def reset_global_stats(stats_file=STATS_FILE):
 
 
 def increment_song_play(stats_file: str = STATS_FILE) -> Dict[str, Any]:
-    """Atomically increment both total and session song play counters and emit once.
+    """Increment both total and session song play counters in one buffered update.
 
-    This avoids two back-to-back writes (and two events) that can race a concurrent
-    reader during the brief file truncation window.
+    Both counters land in the same write, and STATS_UPDATED fires once per call.
     """
-    stats = load_stats(stats_file)
-    stats["total_song_plays"] = stats.get("total_song_plays", 0) + 1
-    stats["session_song_plays"] = stats.get("session_song_plays", 0) + 1
-    save_stats(stats, stats_file)
-    emit_event(EventTopic.STATS_UPDATED)
-    return stats
+    return _update_stats(stats_file, {"total_song_plays": 1, "session_song_plays": 1})
 
 
 def increment_song_search(stats_file: str = STATS_FILE) -> Dict[str, Any]:
-    """Atomically increment both total and session song search counters and emit once."""
-    stats = load_stats(stats_file)
-    stats["total_song_searches"] = stats.get("total_song_searches", 0) + 1
-    stats["session_song_searches"] = stats.get("session_song_searches", 0) + 1
-    save_stats(stats, stats_file)
-    emit_event(EventTopic.STATS_UPDATED)
-    return stats
+    """Increment both total and session song search counters in one buffered update."""
+    return _update_stats(stats_file, {"total_song_searches": 1, "session_song_searches": 1})
 
 
 def increment_song_request(stats_file: str = STATS_FILE) -> Dict[str, Any]:
-    """Atomically increment both total and session song request counters and emit once."""
-    stats = load_stats(stats_file)
-    stats["total_song_requests"] = stats.get("total_song_requests", 0) + 1
-    stats["session_song_requests"] = stats.get("session_song_requests", 0) + 1
-    save_stats(stats, stats_file)
-    emit_event(EventTopic.STATS_UPDATED)
-    return stats
+    """Increment both total and session song request counters in one buffered update."""
+    return _update_stats(stats_file, {"total_song_requests": 1, "session_song_requests": 1})
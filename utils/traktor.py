@@ -5,12 +5,20 @@ import os
 import json
 import shutil
 import xml.etree.ElementTree as ET
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Tuple, Optional, Dict, Any
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
 from config.settings import Settings
-from utils.logger import get_logger
+from utils.logger import get_logger, log_success
 
 logger = get_logger(__name__)
 
@@ -47,6 +55,28 @@ def get_latest_traktor_folder(root_path: str) -> str:
         raise ValueError(f"Error finding latest Traktor folder: {e}")
 
 
+@dataclass(slots=True, frozen=True)
+class _ExclusionFilter:
+    """EXCLUDED_ITEMS patterns prepared once per collection scan."""
+
+    file_patterns: Tuple[str, ...]
+    dir_patterns: Tuple[str, ...]
+    is_noop: bool
+
+    @classmethod
+    def from_settings(cls, excluded_items: Optional[dict]) -> "_ExclusionFilter":
+        items = excluded_items or {}
+        file_patterns = tuple(items.get('FILE', ()))
+        dir_patterns = tuple(items.get('DIR', ()))
+        return cls(file_patterns, dir_patterns, not (file_patterns or dir_patterns))
+
+    def excludes(self, file_path: str, dir_path: str) -> bool:
+        if self.is_noop:
+            return False
+        return (any(pattern in file_path for pattern in self.file_patterns) or
+                any(pattern in dir_path for pattern in self.dir_patterns))
+
+
 def count_songs_in_collection(collection_file_path: str, excluded_items: dict) -> int:
     """Count the total number of songs in the Traktor collection, excluding filtered items"""
     if not os.path.exists(collection_file_path):
@@ -56,6 +86,7 @@ def count_songs_in_collection(collection_file_path: str, excluded_items: dict) -
         tree = ET.parse(collection_file_path)
         root = tree.getroot()
         count = 0
+        exclusions = _ExclusionFilter.from_settings(excluded_items)
         
         for entry in root.findall(".//COLLECTION/ENTRY"):
             location = entry.find(".//LOCATION")
@@ -66,8 +97,7 @@ def count_songs_in_collection(collection_file_path: str, excluded_items: dict) -
             dir_path = location.get("DIR", "")
             
             # Skip if it's an excluded item
-            if (any(pattern in file_path for pattern in excluded_items['FILE']) or
-                any(pattern in dir_path for pattern in excluded_items['DIR'])):
+            if exclusions.excludes(file_path, dir_path):
                 continue
                 
             count += 1
@@ -95,6 +125,7 @@ def parse_traktor_collection(collection_file_path: str, search_query: str,
     
     results = []
     search_keywords = search_query.lower().split()
+    exclusions = _ExclusionFilter.from_settings(excluded_items)
     
     for entry in root.findall(".//COLLECTION/ENTRY"):
         location = entry.find(".//LOCATION")
@@ -105,8 +136,7 @@ def parse_traktor_collection(collection_file_path: str, search_query: str,
         dir_path = location.get("DIR", "")
         
         # Skip excluded items
-        if (any(pattern in file_path for pattern in excluded_items['FILE']) or
-            any(pattern in dir_path for pattern in excluded_items['DIR'])):
+        if exclusions.excludes(file_path, dir_path):
             continue
         
         artist = entry.get("ARTIST")
@@ -175,6 +205,7 @@ def get_new_songs(collection_file_path: str, days: int, excluded_items: dict,
     results = []
     cutoff_date = datetime.now() - timedelta(days=days)
     total_new_songs = 0
+    exclusions = _ExclusionFilter.from_settings(excluded_items)
     
     for entry in root.findall(".//COLLECTION/ENTRY"):
         location = entry.find(".//LOCATION")
@@ -185,8 +216,7 @@ def get_new_songs(collection_file_path: str, days: int, excluded_items: dict,
         dir_path = location.get("DIR", "")
         
         # Skip excluded items
-        if (any(pattern in file_path for pattern in excluded_items['FILE']) or
-            any(pattern in dir_path for pattern in excluded_items['DIR'])):
+        if exclusions.excludes(file_path, dir_path):
             continue
         
         info = entry.find(".//INFO")
@@ -257,6 +287,7 @@ def convert_collection_xml_to_json(xml_file_path: str, json_file_path: str, excl
         
         songs = []
         processed_count = 0
+        exclusions = _ExclusionFilter.from_settings(excluded_items)
         
         for entry in root.findall(".//COLLECTION/ENTRY"):
             location = entry.find(".//LOCATION")
@@ -266,8 +297,7 @@ def convert_collection_xml_to_json(xml_file_path: str, json_file_path: str, excl
             dir_path = location.get("DIR", "")
             volume = location.get("VOLUME", "")
             # Exclude samples and unwanted items
-            if (any(pattern in file_path for pattern in excluded_items['FILE']) or
-                any(pattern in dir_path for pattern in excluded_items['DIR'])):
+            if exclusions.excludes(file_path, dir_path):
                 continue
             # Compose full audio file path
             dir_clean = dir_path.replace(":", os.sep).replace("/", os.sep).replace("\\", os.sep).strip(os.sep)
@@ -337,10 +367,15 @@ def convert_collection_xml_to_json(xml_file_path: str, json_file_path: str, excl
         raise ValueError(f"Error converting XML to JSON: {e}")
 
 
-def refresh_collection_json(original_traktor_path: str, json_file_path: str, excluded_items: dict, debug_mode: bool = False) -> int:
+def refresh_collection_json(original_traktor_path: str, json_file_path: str, excluded_items: dict, debug_mode: bool = False, snapshot: bool = False) -> int:
     """
-    Complete refresh workflow: copy XML -> convert to JSON -> cleanup
+    Complete refresh workflow: parse XML -> convert to JSON -> cleanup
     Returns the number of songs processed.
+
+    The collection is parsed in place; the JSON is written atomically by
+    safe_write_json, so a failed parse never leaves a torn collection.json.
+    Pass ``snapshot=True`` to parse from a temporary copy of the NML instead
+    (doubles disk I/O).
     """
     temp_xml_path = "collection_temp.nml"
     working_nml_path = "collection.nml"  # The .nml file that gets created in working directory
@@ -348,18 +383,21 @@ def refresh_collection_json(original_traktor_path: str, json_file_path: str, exc
     try:
         logger.debug(f"Looking for Traktor collection at: {original_traktor_path}")
 
-        # Step 1: Copy the original collection file to temp location
-        logger.debug("Copying collection.nml to temporary file")
-        shutil.copyfile(original_traktor_path, temp_xml_path)
+        # Step 1: Optionally snapshot the original collection file to a temp location
+        source_path = original_traktor_path
+        if snapshot:
+            logger.debug("Copying collection.nml to temporary file")
+            shutil.copyfile(original_traktor_path, temp_xml_path)
+            source_path = temp_xml_path
 
         # Step 2: Convert XML to JSON
         logger.debug("Converting XML to JSON format")
-        song_count = convert_collection_xml_to_json(temp_xml_path, json_file_path, excluded_items, debug_mode)
+        song_count = convert_collection_xml_to_json(source_path, json_file_path, excluded_items, debug_mode)
         logger.debug(f"Processed {song_count} tracks from collection")
 
         # Step 3: Clean up temporary XML file
         logger.debug("Cleaning up temporary files")
-        if os.path.exists(temp_xml_path):
+        if snapshot and os.path.exists(temp_xml_path):
             os.remove(temp_xml_path)
             logger.debug("Removed temporary collection file")
           # Step 4: Clean up working directory .nml file if it exists
@@ -375,7 +413,8 @@ def refresh_collection_json(original_traktor_path: str, json_file_path: str, exc
     except Exception as e:
         logger.error(f"Collection import failed: {e}")
         # Clean up any temp files if they exist
-        for cleanup_path in [temp_xml_path, working_nml_path]:
+        cleanup_paths = [temp_xml_path, working_nml_path] if snapshot else [working_nml_path]
+        for cleanup_path in cleanup_paths:
             if os.path.exists(cleanup_path):
                 try:
                     os.remove(cleanup_path)
@@ -395,20 +434,51 @@ def load_collection_json(json_file_path: str) -> List[Dict[str, Any]]:
         return []
         
     try:
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # Parse from raw bytes: orjson decodes UTF-8 itself, and json.loads accepts bytes too
+        with open(json_file_path, 'rb') as f:
+            return _loads(f.read())
     except (json.JSONDecodeError, IOError) as e:
         logger.error(f"Error loading collection JSON: {e}")
         return []
 
 
+# Lowercased (artist, title, album, combined) per song, cached for the last searched songs list
+_search_index_cache: Optional[Tuple[List[Dict[str, Any]], List[Tuple[str, str, str, str]]]] = None
+
+
+def _get_search_index(songs: List[Dict[str, Any]]) -> List[Tuple[str, str, str, str]]:
+    """Return lowercased search fields for *songs*, built once per list identity.
+
+    The fourth field joins all three with newlines (never part of a keyword) so a
+    single substring scan can reject songs that cannot match any field.
+    """
+    global _search_index_cache
+    cached = _search_index_cache
+    if cached is not None and cached[0] is songs and len(cached[1]) == len(songs):
+        return cached[1]
+    index = []
+    for song in songs:
+        artist = song.get("artist", "").lower()
+        title = song.get("title", "").lower()
+        album = song.get("album", "").lower()
+        index.append((artist, title, album, f"{artist}\n{title}\n{album}"))
+    _search_index_cache = (songs, index)
+    return index
+
+
+def invalidate_search_index() -> None:
+    """Drop the cached search index (call after mutating a songs list in place)."""
+    global _search_index_cache
+    _search_index_cache = None
+
+
 def search_collection_json(songs: List[Dict[str, Any]], search_query: str, max_songs: Optional[int] = None) -> Tuple[List[str], int]:
     """
     Search the JSON collection for songs matching the query.
     Returns a tuple of (formatted_results, total_matches).
     If max_songs is None or greater than matches found, returns all matches.
     """
-    logger.debug(f"Searching for '{search_query}' in {len(songs)} songs")
+    logger.debug("Searching for '%s' in %d songs", search_query, len(songs))
     
     if not songs:
         logger.warning("No songs loaded in collection")
@@ -420,12 +490,11 @@ def search_collection_json(songs: List[Dict[str, Any]], search_query: str, max_s
     songs_checked = 0
     matches_found = 0
     
-    for song in songs:
+    for song, (artist, title, album, combined) in zip(songs, _get_search_index(songs)):
         songs_checked += 1
-        
-        artist = song.get("artist", "").lower()
-        title = song.get("title", "").lower()
-        album = song.get("album", "").lower()
+        # A keyword missing from every field rules the song out before per-field checks
+        if search_keywords and not all(keyword in combined for keyword in search_keywords):
+            continue
         
         # Determine priority and sort key
         priority_score = 0
@@ -462,7 +531,7 @@ def search_collection_json(songs: List[Dict[str, Any]], search_query: str, max_s
                 result_str = result_core
             results.append((priority_score, sort_key, result_str))
     
-    logger.debug(f"Search complete. Found {matches_found} matches out of {songs_checked} songs")
+    logger.debug("Search complete. Found %d matches out of %d songs", matches_found, songs_checked)
     
     # Sort results by priority and then by sort key
     results.sort(key=lambda x: (x[0], x[1]))
@@ -473,7 +542,7 @@ def search_collection_json(songs: List[Dict[str, Any]], search_query: str, max_s
         f"{i + 1} | {result[2]}" for i, result in enumerate(results[:limit])
     ]
     
-    logger.debug(f"Returning {len(sorted_results)} formatted results out of {len(results)} total matches")
+    logger.debug("Returning %d formatted results out of %d total matches", len(sorted_results), len(results))
     return sorted_results, len(results)
 
 
@@ -570,7 +639,7 @@ def initialize_collection(traktor_path, collection_json_file, excluded_items, ne
             excluded_items,
             debug_mode=debug_mode
         )
-        logger.info(f"✅ Collection imported successfully - {song_count:,} songs processed")
+        log_success(logger, f"✅ Collection imported successfully - {song_count:,} songs processed")
         songs = load_collection_json(collection_json_file)
         if songs:
             total_songs = count_songs_in_collection_json(songs)